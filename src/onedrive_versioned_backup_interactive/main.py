@@ -26,6 +26,8 @@
 # Windows).
 #   - Run from a normal Command Prompt or PowerShell. Admin may be needed to
 #     register a task at "highest" privileges.
+#   - Optional: pywin32 ('pip install pywin32'). If installed, the Scheduled
+#     Task is registered through the Task Scheduler API instead of schtasks.
 #
 # BACKUP LAYOUT EXAMPLE
 #----------------------
@@ -34,6 +36,12 @@
 #     2025-11-01_09-00\
 #     ...
 #
+#   Each dated folder is a complete, browsable copy, but files that did not
+#   change since the previous dated folder are NTFS hard links to it instead
+#   of new copies (no extra disk space, no copy time). Deleting an old folder
+#   only frees the files no newer folder still links to.
+#   Use --full-copy to copy every file into every folder instead.
+#
 # RETURN CODES
 #-------------
 #   - 0  success
@@ -47,6 +55,40 @@
 #   Headless mode (used by scheduled task):
 #     python main.py --headless-run --backup-root "D:\\OneDriveBackup" --retention-days 30
 #
+#   Headless mode with fewer robocopy threads (e.g., HDD backup target):
+#     python main.py --headless-run --backup-root "D:\\OneDriveBackup" --retention-days 30 --threads 8
+#
+#   Headless mode with unbuffered I/O for OneDrives full of large files:
+#     python main.py --headless-run --backup-root "D:\\OneDriveBackup" --retention-days 30 --large-files
+#
+#   Headless mode reading from a VSS shadow copy (requires Administrator):
+#     python main.py --headless-run --backup-root "D:\\OneDriveBackup" --retention-days 30 --use-vss
+#
+#   Headless mode copying every file again (no hard links, e.g. non-NTFS target):
+#     python main.py --headless-run --backup-root "D:\\OneDriveBackup" --retention-days 30 --full-copy
+#
+#   Headless mode copying each top-level OneDrive folder with its own robocopy:
+#     python main.py --headless-run --backup-root "D:\\OneDriveBackup" --retention-days 30 --parallel-subtrees
+#
+#   Headless mode skipping the copy when the OneDrive volume's change journal
+#   shows no changes (only useful when OneDrive has a volume to itself):
+#     python main.py --headless-run --backup-root "D:\\OneDriveBackup" --retention-days 30 --skip-unchanged
+#
+#   Headless mode handing the process over to robocopy (no exit code check):
+#     python main.py --headless-run --backup-root "D:\\OneDriveBackup" --retention-days 30 --exec-replace
+#
+#   Scripted setup from a JSON settings file (no prompts):
+#     python main.py --config "backup_settings.json"
+#
+#   Interactive setup registering the task while the one-time backup runs:
+#     python main.py --parallel-setup
+#
+#   Setup with every default, no prompts (backs up now, installs the task):
+#     python main.py --yes --backup-root "D:\\OneDriveBackup"
+#
+#   Prune only (no copy; used by headless runs to delete in the background):
+#     python main.py --prune-only --backup-root "D:\\OneDriveBackup" --retention-days 30
+#
 # ROBOCOPY EXIT CODES
 #-------------------
 #   0 - No files were copied. No failure was encountered. No files were mismatched.
@@ -77,13 +119,26 @@
 # IMPORTS USED IN THIS SCRIPT
 # -----------------------------
 import os
-import re
+import json
+import argparse
 import sys
+import time
 import shutil
+import tempfile
+import functools
+import contextlib
+import threading
 import subprocess
 import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
+from xml.sax.saxutils import escape
 from pathlib import Path
-from typing import Tuple, List
+from typing import Iterator, Optional, Tuple, List, Union
+
+
+# Interpreter the scheduled task and the detached prune run, taken once at
+# import; the script path is resolved lazily (see _script_path)
+_PYTHON_EXE: str = sys.executable
 
 
 # =============================
@@ -98,359 +153,58 @@ DEFAULT_TASK_NAME = "OneDriveVersionedBackup"  # Windows Scheduled Task name (de
 DEFAULT_SCHEDULE_TYPE = "DAILY"                # DAILY, HOURLY, MINUTE supported (DAILY is most common)
 DEFAULT_START_TIME = "09:00"                   # 24-hour HH:MM for DAILY schedule (9 AM typical work start)
 DEFAULT_MODIFIER = 1                           # HOURLY: every 1 hour; MINUTE: every 1 minute (minimum interval)
-
-# Regular expression pattern to identify our dated snapshot folders
+DEFAULT_THREADS = min(32, max(8, os.cpu_count() or 8))  # Robocopy /MT threads: CPU count clamped to 8-32 (use 4-8 for HDDs)
+MAX_THREADS = 128                              # Highest /MT robocopy accepts (1-128); prompt, --config and --threads all check it
+PARALLEL_COPY_WORKERS = min(8, os.cpu_count() or 1)  # Max robocopy processes with --parallel-subtrees
+PRUNE_MAX_WORKERS = min(8, os.cpu_count() or 1)  # Max snapshots deleted in parallel (never more than CPUs; higher thrashes HDDs)
+LAST_SIZE_FILE = ".last_backup_size"           # Bytes written by the last backup (kept in the backup root)
+DISK_SPACE_MARGIN = 1.1                        # Require 10% more free space than the last backup used
+SCRIPT_PATH_FILE = ".script_path"              # Resolved script path cached at task install (in the backup root)
+LAST_USN_FILE = ".last_usn"                    # Change journal position when the last backup started (in the backup root)
+DEFAULT_INCREMENTAL = True                     # Hard-link unchanged files to the previous backup (--full-copy disables)
+
+# Shape of our dated snapshot folder names (see is_stamp_name)
 # Format: YYYY-MM-DD_HH-MM (e.g., 2025-01-15_09-30)
-# This pattern ensures we only touch folders we created, not user data
-STAMP_RE = re.compile(r"^\d{4}-\d{2}-\d{2}_\d{2}-\d{2}$")
+# Checking this shape ensures we only touch folders we created, not user data
+STAMP_LEN = 16                                 # len("YYYY-MM-DD_HH-MM")
+STAMP_FMT = "%Y-%m-%d_%H-%M"                   # strftime format of folder names (see timestamp_stamp) and the prune cutoff
 
+# Schedule types built once at import, so membership tests are one hash lookup
+# (the accepted /SC values are prompts.SCHEDULE_TYPES, shared with the wizard)
+_INTERVAL_SCHEDULES = frozenset(("HOURLY", "MINUTE"))       # Types that repeat every /MO units
 
 # =============================
-# UTILITIES: INPUT + VALIDATION
+# INTERACTIVE PROMPTS (LAZY)
 # =============================
 
-def prompt_with_default(prompt_text: str, default_value: str) -> str:
-    """
-    Display an interactive prompt with a default value shown in brackets.
-    
-    This function provides a user-friendly way to collect input with sensible defaults.
-    The user can press Enter without typing to accept the default value.
-    
-    Args:
-        prompt_text (str): The question or instruction to display to the user.
-                          Should not include the brackets for the default.
-        default_value (str): The value to use if user presses Enter without input.
-                           This value is displayed in square brackets.
-    
-    Returns:
-        str: The user's input if provided, otherwise the default value.
-             Always returns a string, even for numeric defaults.
-    
-    Example:
-        >>> name = prompt_with_default("Enter your name", "John")
-        Enter your name [John]: Jane
-        >>> print(name)
-        'Jane'
-        
-        >>> path = prompt_with_default("Backup location", "D:\\Backup")
-        Backup location [D:\\Backup]: <user presses Enter>
-        >>> print(path)
-        'D:\\Backup'
-    
-    Note:
-        - Leading and trailing whitespace is stripped from user input
-        - Empty string defaults are handled correctly
-        - The function always returns a string type
-    """
-    # Format the prompt with the default value in square brackets
-    response = input(f"{prompt_text} [{default_value}]: ").strip()
-    
-    # Return user input if provided, otherwise return the default
-    # Convert default to string to ensure consistent return type
-    return response if response else str(default_value)
-
-def prompt_int_with_default(prompt_text: str, default_value: int, min_value: int = 1) -> int:
-    """
-    Prompt for an integer value with validation and a default option.
-    
-    This function repeatedly prompts until valid input is received. It ensures
-    the returned value meets the minimum threshold requirement.
-    
-    Args:
-        prompt_text (str): The instruction text to display to the user.
-                          Should describe what integer is being requested.
-        default_value (int): The integer to use if user presses Enter without input.
-                           Must be >= min_value to be valid.
-        min_value (int, optional): The minimum acceptable value. Defaults to 1.
-                                  Used to prevent invalid inputs like 0 or negative numbers.
-    
-    Returns:
-        int: A validated integer that is >= min_value.
-    
-    Example:
-        >>> days = prompt_int_with_default("Retention days", 30, min_value=1)
-        Retention days [30]: 45
-        >>> print(days)
-        45
-        
-        >>> hours = prompt_int_with_default("Interval in hours", 24, min_value=1)
-        Interval in hours [24]: 0
-        Enter an integer >= 1.
-        Interval in hours [24]: 12
-        >>> print(hours)
-        12
-    
-    Validation Process:
-        1. Check if input is empty (use default)
-        2. Check if input contains only digits
-        3. Check if integer value meets minimum requirement
-        4. Re-prompt if any validation fails
-    
-    Note:
-        - Non-numeric input triggers re-prompt with error message
-        - Values below min_value trigger re-prompt
-        - Function loops indefinitely until valid input received
-    """
-    while True:
-        # Get raw input from user
-        raw = input(f"{prompt_text} [{default_value}]: ").strip()
-        
-        # Handle empty input - return default
-        if raw == "":
-            return int(default_value)
-        
-        # Validate numeric input
-        if raw.isdigit():
-            val = int(raw)
-            # Check minimum value constraint
-            if val >= min_value:
-                return val
-        
-        # Invalid input - show error and loop
-        print(f"Enter an integer >= {min_value}.")
-
-def prompt_yes_no_default(prompt_text: str, default_yes: bool = False) -> bool:
-    """
-    Present a yes/no question with a default answer indicated by capitalization.
-    
-    This function follows Unix convention where the capitalized option is the default.
-    For example: [Y/n] means Yes is default, [y/N] means No is default.
-    
-    Args:
-        prompt_text (str): The yes/no question to ask the user.
-                          Should be phrased as a question but without the question mark.
-        default_yes (bool, optional): If True, default to Yes. If False, default to No.
-                                     Defaults to False (No) for safety.
-    
-    Returns:
-        bool: True if user chooses yes, False if user chooses no.
-    
-    Example:
-        >>> proceed = prompt_yes_no_default("Continue with backup", default_yes=True)
-        Continue with backup [Y/n]: <Enter>
-        >>> print(proceed)
-        True
-        
-        >>> delete = prompt_yes_no_default("Delete old files", default_yes=False)
-        Delete old files [y/N]: n
-        >>> print(delete)
-        False
-    
-    Accepted Inputs:
-        - For Yes: 'y', 'yes' (case-insensitive)
-        - For No: 'n', 'no' (case-insensitive)
-        - Empty input: uses the default based on default_yes parameter
-    
-    Note:
-        - Invalid inputs trigger re-prompt with instruction
-        - Input is case-insensitive
-        - Empty input always returns the default value
-    """
-    # Format the prompt options based on default
-    # Capital letter indicates the default option
-    default_str = "Y/n" if default_yes else "y/N"
-    
-    while True:
-        # Get user input and normalize to lowercase
-        raw = input(f"{prompt_text} [{default_str}]: ").strip().lower()
-        
-        # Handle empty input - return default
-        if raw == "" and not default_yes:
-            return False
-        if raw == "" and default_yes:
-            return True
-        
-        # Check for affirmative responses
-        if raw in ("y", "yes"):
-            return True
-        
-        # Check for negative responses
-        if raw in ("n", "no"):
-            return False
-        
-        # Invalid input - show instruction and loop
-        print("Answer y or n.")
-
-def validate_time_hhmm(hhmm: str) -> bool:
-    """
-    Validate a time string in 24-hour HH:MM format.
-    
-    This function checks both the format and the logical validity of the time.
-    It ensures hours are 00-23 and minutes are 00-59.
-    
-    Args:
-        hhmm (str): Time string to validate, expected format "HH:MM".
-    
-    Returns:
-        bool: True if the time is valid, False otherwise.
-    
-    Example:
-        >>> validate_time_hhmm("09:30")
-        True
-        >>> validate_time_hhmm("24:00")  # Invalid hour
-        False
-        >>> validate_time_hhmm("12:60")  # Invalid minute
-        False
-        >>> validate_time_hhmm("9:30")   # Missing leading zero
-        False
-    
-    Validation Rules:
-        1. Must match pattern: exactly 2 digits, colon, 2 digits
-        2. Hour component must be 00-23 (24-hour format)
-        3. Minute component must be 00-59
-    
-    Note:
-        - Leading zeros are required (09:05, not 9:5)
-        - 24:00 is invalid (use 00:00 for midnight)
-        - Does not validate semantic meaning (e.g., business hours)
-    """
-    # Check format: must be exactly HH:MM with all digits
-    if not re.fullmatch(r"\d{2}:\d{2}", hhmm):
-        return False
-    
-    # Split and validate components
-    hh, mm = hhmm.split(":")
-    
-    # Validate hour is 00-23 and minute is 00-59
-    return 0 <= int(hh) <= 23 and 0 <= int(mm) <= 59
-
-def prompt_time_hhmm(prompt_text: str, default_value: str) -> str:
+def _prompts():
     """
-    Prompt for a time in 24-hour HH:MM format with validation.
-    
-    This function ensures the user provides a valid time string, re-prompting
-    if the input is invalid. It's used for scheduling tasks at specific times.
+    Import the interactive prompt helpers (prompts.py) on first use.
     
-    Args:
-        prompt_text (str): The instruction to show the user.
-                          Should explain what time is being requested.
-        default_value (str): The default time in HH:MM format to use if user
-                           presses Enter. Should be pre-validated.
+    The wizard prompts are only needed interactively and for --config
+    validation, so headless runs from the Scheduled Task (every minute on
+    MINUTE schedules) skip loading them.
     
     Returns:
-        str: A validated time string in HH:MM format.
-    
-    Example:
-        >>> start = prompt_time_hhmm("Daily backup time", "09:00")
-        Daily backup time [09:00]: 14:30
-        >>> print(start)
-        '14:30'
-        
-        >>> time = prompt_time_hhmm("Schedule time", "09:00")
-        Schedule time [09:00]: 25:00
-        Use 24-hour HH:MM, e.g., 09:00 or 18:30.
-        Schedule time [09:00]: 00:00
-        >>> print(time)
-        '00:00'
+        module: The prompts module.
     
     Note:
-        - Continuously prompts until valid input received
-        - Shows helpful error message with format examples
-        - Always returns a string in HH:MM format
-    """
-    while True:
-        # Get time input from user
-        t = prompt_with_default(prompt_text, default_value)
-        
-        # Validate the time format and values
-        if validate_time_hhmm(t):
-            return t
-        
-        # Invalid input - show examples and loop
-        print("Use 24-hour HH:MM, e.g., 09:00 or 18:30.")
-
-def prompt_schedule() -> Tuple[str, str, int]:
+        - Works both as a package module and as a plain script
+          ("python main.py" puts this folder on sys.path)
+        - Later calls are a sys.modules lookup
     """
-    Interactively collect scheduling preferences from the user.
-    
-    This function guides the user through choosing how often the backup task
-    should run, with support for daily, hourly, and minute-based schedules.
-    
-    Returns:
-        Tuple[str, str, int]: A tuple containing:
-            - schedule_type (str): One of "DAILY", "HOURLY", or "MINUTE"
-            - start_time (str): Time in HH:MM format for task alignment
-            - modifier (int): Interval modifier (1 for DAILY, N for HOURLY/MINUTE)
-    
-    Schedule Types Explained:
-        DAILY:
-            - Runs once per day at a specific time
-            - User specifies the exact time (e.g., 09:00)
-            - Modifier is always 1 (ignored by schtasks)
-            - Best for: Regular daily backups
-        
-        HOURLY:
-            - Runs every N hours
-            - User specifies interval (e.g., every 2 hours)
-            - Start time aligns the schedule (first run)
-            - Best for: Frequent backups during work hours
-        
-        MINUTE:
-            - Runs every N minutes
-            - User specifies interval (e.g., every 30 minutes)
-            - Start time provides initial alignment
-            - Best for: Critical data or testing
-    
-    Example Interaction:
-        Schedule type options supported here:
-          DAILY  - run once each day at the time you choose
-          HOURLY - run every N hours
-          MINUTE - run every N minutes
-        Choose schedule type (DAILY|HOURLY|MINUTE) [DAILY]: HOURLY
-        Every how many hours? (modifier /MO) [1]: 4
-        Start time (HH:MM) for first run [09:00]: 08:00
-        
-        Returns: ("HOURLY", "08:00", 4)
-    
-    Note:
-        - Input is case-insensitive (converted to uppercase)
-        - Invalid schedule types trigger re-prompt
-        - Each schedule type has appropriate follow-up questions
-    """
-    # Display clear options to the user
-    print("\nSchedule type options supported here:")
-    print("  DAILY  - run once each day at the time you choose")
-    print("  HOURLY - run every N hours")
-    print("  MINUTE - run every N minutes")
-
-    # Get and validate schedule type
-    while True:
-        sched = prompt_with_default("Choose schedule type (DAILY|HOURLY|MINUTE)", DEFAULT_SCHEDULE_TYPE).upper()
-        if sched in ("DAILY", "HOURLY", "MINUTE"):
-            break
-        print("Type DAILY, HOURLY, or MINUTE.")
-
-    # Initialize return values with defaults
-    start_time = DEFAULT_START_TIME
-    modifier = DEFAULT_MODIFIER
-
-    # Collect schedule-specific parameters
-    if sched == "DAILY":
-        # DAILY schedule: runs once per day at specified time
-        # schtasks command will use: /SC DAILY /ST HH:MM
-        start_time = prompt_time_hhmm("Start time (HH:MM) for daily run", DEFAULT_START_TIME)
-        modifier = 1  # Modifier is ignored by schtasks for DAILY, but we keep it for consistency
-        
-    elif sched == "HOURLY":
-        # HOURLY schedule: runs every N hours starting at specified time
-        # schtasks command will use: /SC HOURLY /MO N /ST HH:MM
-        modifier = prompt_int_with_default("Every how many hours? (modifier /MO)", DEFAULT_MODIFIER, min_value=1)
-        start_time = prompt_time_hhmm("Start time (HH:MM) for first run", DEFAULT_START_TIME)
-        
-    elif sched == "MINUTE":
-        # MINUTE schedule: runs every N minutes
-        # schtasks command will use: /SC MINUTE /MO N /ST HH:MM
-        modifier = prompt_int_with_default("Every how many minutes? (modifier /MO)", DEFAULT_MODIFIER, min_value=1)
-        # Start time for minute schedules helps with alignment but is optional in schtasks
-        start_time = prompt_time_hhmm("Start time (HH:MM) to align first run", DEFAULT_START_TIME)
-
-    return sched, start_time, modifier
+    if __package__:
+        from . import prompts
+    else:
+        import prompts
+    return prompts
 
 
 # =============================
 # PATHS AND ROBUSTNESS HELPERS
 # =============================
 
+@functools.lru_cache(maxsize=1)
 def onedrive_path() -> Path:
     """
     Intelligently resolve the OneDrive root directory path.
@@ -481,6 +235,7 @@ def onedrive_path() -> Path:
     
     Note:
         - Does not verify the path exists (caller should check)
+        - Cached after the first call (environment is read only once)
         - Returns Path object for cross-platform compatibility
         - Handles spaces and special characters in path names
     """
@@ -490,6 +245,57 @@ def onedrive_path() -> Path:
     # Return environment path if available, otherwise use standard location
     return Path(p) if p else Path(os.path.expandvars(r"%UserProfile%\OneDrive"))
 
+@functools.lru_cache(maxsize=1)
+def _script_path() -> Path:
+    """
+    Return the absolute, symlink-resolved path to this script.
+    
+    Path.resolve() stats every path component, so it only runs when a
+    caller needs the path (task install, detached prune), at most once per
+    process, and never at import.
+    
+    Returns:
+        Path: Absolute path to this script file.
+    """
+    return Path(__file__).resolve()
+
+def _installed_script_path(backup_root: Path) -> Path:
+    """
+    Return the resolved script path, reusing the one cached in the backup root.
+    
+    The cache file holds two lines: the script's plain absolute path and its
+    resolved path. The cached resolved path is reused only if the plain path
+    still matches and the file still exists, so moving or copying the script
+    is always detected, while a reinstall from the same place skips resolve().
+    
+    Args:
+        backup_root (Path): Backup destination directory (holds the cache file).
+    
+    Returns:
+        Path: Absolute, symlink-resolved path to this script file.
+    
+    Note:
+        - os.path.abspath is pure string work (no filesystem access)
+        - The cache is only written if the backup root already exists
+    """
+    cache = Path(backup_root) / SCRIPT_PATH_FILE
+    plain = os.path.abspath(__file__)
+    
+    # Reuse the cached resolution if it was made for this same script file
+    try:
+        cached_plain, cached_resolved = cache.read_text(encoding="utf-8").splitlines()
+        if cached_plain == plain and os.path.isfile(cached_resolved):
+            return Path(cached_resolved)
+    except (OSError, ValueError):
+        # Missing or malformed cache - resolve below
+        pass
+    
+    resolved = _script_path()
+    if os.path.isdir(backup_root):
+        with contextlib.suppress(OSError):
+            cache.write_text(f"{plain}\n{resolved}\n", encoding="utf-8")
+    return resolved
+
 def timestamp_stamp() -> str:
     """
     Generate a timestamp string suitable for folder naming.
@@ -518,19 +324,269 @@ def timestamp_stamp() -> str:
     
     Note:
         - Always uses local system time
-        - Format matches STAMP_RE regex pattern
+        - Result is accepted by is_stamp_name
         - Leading zeros ensure consistent sorting
+        - Same output as strftime(STAMP_FMT), built directly from the
+          time.localtime() fields without format-string interpretation
     """
     # Generate timestamp using current local time
     # Format: YYYY-MM-DD_HH-MM (e.g., 2025-01-15_09-30)
-    return dt.datetime.now().strftime("%Y-%m-%d_%H-%M")
+    t = time.localtime()
+    return f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}_{t.tm_hour:02d}-{t.tm_min:02d}"
+
+def is_stamp_name(name: str) -> bool:
+    """
+    Check whether a folder name has our YYYY-MM-DD_HH-MM snapshot shape.
+    
+    The shape is fixed, so instead of a regular expression this checks the
+    length, the four separators at their known offsets, and that everything
+    else is an ASCII digit.
+    
+    Args:
+        name (str): Folder name to check (no path).
+    
+    Returns:
+        bool: True if `name` looks like a timestamp_stamp() result.
+    
+    Example:
+        >>> is_stamp_name("2025-01-15_09-30")
+        True
+        >>> is_stamp_name("MyImportantData")
+        False
+    
+    Note:
+        - Checks shape only; "2025-13-99_99-99" is accepted, which is fine
+          because names are only ever compared as strings, never parsed
+        - Most unrelated names are rejected by the length check alone
+    """
+    # Length and separators first: cheapest, and rejects nearly everything else
+    if len(name) != STAMP_LEN:
+        return False
+    if name[4] != "-" or name[7] != "-" or name[10] != "_" or name[13] != "-":
+        return False
+    
+    # The remaining 12 characters must all be digits; isascii stops
+    # isdigit from accepting other scripts' digits or superscripts
+    digits = name[:4] + name[5:7] + name[8:10] + name[11:13] + name[14:]
+    return digits.isascii() and digits.isdigit()
+
+
+# =============================
+# VOLUME SHADOW COPY (VSS) HELPERS
+# =============================
+
+def create_shadow_copy(volume: str) -> Optional[Tuple[str, str]]:
+    """
+    Create a VSS shadow copy of a volume.
+    
+    A shadow copy is a read-only, point-in-time view of the whole volume.
+    Backing up from it means files that OneDrive or Office are writing to
+    during the backup no longer cause robocopy retries (/R:1 /W:1).
+    
+    Args:
+        volume (str): Volume root, e.g. "C:\\".
+    
+    Returns:
+        Optional[Tuple[str, str]]: (shadow_id, device_object) on success,
+        e.g. ("{GUID}", "\\\\?\\GLOBALROOT\\Device\\HarddiskVolumeShadowCopy3"),
+        or None if the shadow copy could not be created.
+    
+    Note:
+        - Requires Administrator rights
+        - Uses the Win32_ShadowCopy CIM class through PowerShell, because
+          "vssadmin create shadow" only exists on Windows Server and wmic
+          is deprecated
+    """
+    script = (
+        "$r = Invoke-CimMethod -ClassName Win32_ShadowCopy -MethodName Create "
+        f"-Arguments @{{Volume='{volume}'; Context='ClientAccessible'}}; "
+        "if ($r.ReturnValue -ne 0) { exit [int]$r.ReturnValue }; "
+        "$s = Get-CimInstance Win32_ShadowCopy | Where-Object { $_.ID -eq $r.ShadowID }; "
+        "Write-Output $s.ID; Write-Output $s.DeviceObject"
+    )
+    try:
+        res = subprocess.run(["powershell", "-NoProfile", "-NonInteractive", "-Command", script],
+                             capture_output=True, text=True)
+    except OSError:
+        # PowerShell not available
+        return None
+    
+    # Expect exactly two lines: the shadow ID and its device object path
+    lines = [line.strip() for line in res.stdout.splitlines() if line.strip()]
+    if res.returncode != 0 or len(lines) != 2:
+        return None
+    return lines[0], lines[1]
+
+def delete_shadow_copy(shadow_id: str) -> None:
+    """
+    Delete a shadow copy created by create_shadow_copy().
+    
+    Args:
+        shadow_id (str): Shadow copy ID including braces, e.g. "{GUID}".
+    
+    Note:
+        - Best-effort; failures are ignored (Windows also ages out shadows)
+    """
+    try:
+        subprocess.run(["vssadmin", "delete", "shadows", f"/Shadow={shadow_id}", "/Quiet"],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+    except OSError:
+        pass
+
+@contextlib.contextmanager
+def shadow_copy_source(src: Path) -> Iterator[Path]:
+    """
+    Yield a path to `src` inside a temporary VSS shadow copy.
+    
+    Robocopy can't read the shadow's \\\\?\\GLOBALROOT device path directly, so
+    a temporary directory symlink to the shadow's root is created and the
+    OneDrive path is re-based onto it. The link and the shadow copy are always
+    released on exit (try/finally).
+    
+    Args:
+        src (Path): Live source directory (the OneDrive folder).
+    
+    Yields:
+        Path: The same folder inside the shadow copy, or `src` itself if the
+              shadow copy or the link could not be created.
+    
+    Example:
+        >>> with shadow_copy_source(Path("C:/Users/John/OneDrive")) as snap:
+        ...     run_robocopy(snap, dst)
+    
+    Note:
+        - Requires Administrator rights (shadow copy + symlink creation)
+        - Falls back to the live folder with a warning instead of failing
+    """
+    # Shadow copies are per-volume, e.g. C:\ for C:\Users\John\OneDrive
+    shadow = create_shadow_copy(src.anchor)
+    if shadow is None:
+        print("Could not create a VSS shadow copy; backing up the live OneDrive folder.", file=sys.stderr)
+        yield src
+        return
+    shadow_id, device = shadow
+    
+    # Link a temporary folder to the shadow's volume root
+    link_parent = Path(tempfile.mkdtemp(prefix="onedrive_vss_"))
+    link = link_parent / "shadow"
+    try:
+        # The trailing backslash is required for the link to resolve
+        os.symlink(device + "\\", link, target_is_directory=True)
+    except OSError:
+        # Can't link (e.g., missing privilege) - release and use the live folder
+        link_parent.rmdir()
+        delete_shadow_copy(shadow_id)
+        print("Could not link to the VSS shadow copy; backing up the live OneDrive folder.", file=sys.stderr)
+        yield src
+        return
+    
+    try:
+        # Same relative path as the live folder, but inside the snapshot
+        yield link / src.relative_to(src.anchor)
+    finally:
+        # rmdir removes only the directory symlink, never the shadow's contents
+        with contextlib.suppress(OSError):
+            os.rmdir(link)
+            link_parent.rmdir()
+        delete_shadow_copy(shadow_id)
 
 
 # =============================
 # CORE BACKUP AND PRUNING
 # =============================
 
-def run_robocopy(src: Path, dst: Path) -> int:
+# Serializes robocopy output when several runs stream at once
+_OUTPUT_LOCK = threading.Lock()
+
+# Robocopy options used by every run, built once (see run_robocopy docstring)
+_ROBOCOPY_BASE_FLAGS = (
+    "/FFT",        # Use FAT file time (2-second precision)
+    "/COPY:DAT",   # Copy data, attributes and timestamps only (no ACLs/owner/audit)
+    "/R:1",        # Retry once on failure
+    "/W:1",        # Wait 1 second between retries
+    "/NJH",        # Don't print the job header
+    "/NP",         # Don't print per-file percentage progress
+    "/BYTES",      # Sizes as exact byte counts (read back from the job summary)
+)
+
+# Output kept from the end of each robocopy run; the job summary, with its
+# "Bytes :" line, is the last few hundred bytes
+_ROBOCOPY_TAIL_BYTES = 8192
+
+def _robocopy_copied_bytes(output_tail: bytes) -> Optional[int]:
+    """
+    Read the number of bytes copied from the end of robocopy's output.
+    
+    With /BYTES the job summary line is e.g.
+        "   Bytes :  1048576  65536  983040  0  0  0"
+    (Total, Copied, Skipped, Mismatch, FAILED, Extras).
+    
+    Args:
+        output_tail (bytes): The last part of robocopy's output.
+    
+    Returns:
+        Optional[int]: The Copied column, or None if no summary line was
+                       found (e.g., a non-English robocopy).
+    """
+    for line in reversed(output_tail.splitlines()):
+        label, sep, values = line.partition(b":")
+        if sep and label.strip() == b"Bytes":
+            fields = values.split()
+            if len(fields) >= 2 and fields[1].isdigit():
+                return int(fields[1])
+            return None
+    return None
+
+def _robocopy_command(
+    src: Path,
+    dst: Path,
+    threads: int,
+    verbose: bool,
+    large_files: bool,
+    keep_existing: bool,
+    recurse: bool = True
+) -> List[str]:
+    """
+    Build the robocopy argv for one copy (see run_robocopy for the options).
+    
+    Shared by run_robocopy and the --exec-replace path of headless_run, so
+    both always run the same command.
+    """
+    # Only the paths, the mode and the thread count vary per call; the fixed
+    # options come from _ROBOCOPY_BASE_FLAGS
+    cmd = [
+        "robocopy",
+        str(src),      # Source directory
+        str(dst),      # Destination directory  
+        "/MIR" if recurse else "/PURGE",  # Mirror source to destination (top level only with /PURGE)
+        *_ROBOCOPY_BASE_FLAGS,
+        f"/MT:{threads}",  # Copy with N parallel threads
+    ]
+    
+    # Per-file and per-directory lines are only worth their cost when the
+    # user asked to see them
+    if not verbose:
+        cmd.extend(["/NFL", "/NDL"])  # Don't log individual file/dir names
+    
+    # Unbuffered I/O helps big files but hurts small ones, so only on request
+    if large_files:
+        cmd.append("/J")
+    
+    # Hard-linked files must never be written through (see run_robocopy)
+    if keep_existing:
+        cmd.extend(["/XC", "/XN", "/XO"])
+    
+    return cmd
+
+def run_robocopy(
+    src: Path,
+    dst: Path,
+    threads: int = DEFAULT_THREADS,
+    verbose: bool = False,
+    large_files: bool = False,
+    keep_existing: bool = False,
+    recurse: bool = True
+) -> Tuple[int, Optional[int]]:
     """
     Execute robocopy to mirror OneDrive to a backup folder.
     
@@ -541,9 +597,26 @@ def run_robocopy(src: Path, dst: Path) -> int:
     Args:
         src (Path): Source path (OneDrive folder) to copy from.
         dst (Path): Destination path (backup folder) to copy to.
+        threads (int, optional): Number of robocopy copy threads (/MT:N).
+                                Defaults to DEFAULT_THREADS.
+        verbose (bool, optional): If True, also stream robocopy's stderr
+                                 and list every file and folder copied.
+                                 Defaults to False (stderr discarded).
+        large_files (bool, optional): If True, add /J (unbuffered I/O).
+                                     Defaults to False.
+        keep_existing (bool, optional): If True, add /XC /XN /XO so files
+                                       already in dst are never overwritten.
+                                       Required when dst holds hard links.
+        recurse (bool, optional): If False, use /PURGE instead of /MIR: copy
+                                 only the files directly in src, and delete
+                                 files and folders in dst that are no longer
+                                 in src, without descending into subfolders.
+                                 Used by run_robocopy_parallel.
     
     Returns:
-        int: Robocopy exit code. Codes < 8 indicate success, >= 8 indicate errors.
+        Tuple[int, Optional[int]]: Robocopy exit code (codes < 8 indicate
+            success, >= 8 indicate errors), and the bytes robocopy reports
+            as copied in its job summary (None if it couldn't be read).
     
     Robocopy Options Used:
         /MIR (Mirror):
@@ -557,6 +630,13 @@ def run_robocopy(src: Path, dst: Path) -> int:
             - Helps with timestamp differences between filesystems
             - Reduces unnecessary copies due to precision mismatches
         
+        /COPY:DAT (Data, Attributes, Timestamps):
+            - Never copies security (S), owner (O) or auditing (U) info
+            - Spelled out so the backup never picks up /COPYALL or /SEC
+              style options, which add per-file security calls and need
+              extra privileges
+            - Backups inherit the permissions of the backup folder
+        
         /R:1 (Retry):
             - Retry failed copies only once
             - Default is 1 million retries (too many for our use)
@@ -566,6 +646,39 @@ def run_robocopy(src: Path, dst: Path) -> int:
             - Wait 1 second between retries
             - Default is 30 seconds (too long for single retry)
             - Keeps the process moving quickly
+        
+        /NFL /NDL /NJH /NP (Quiet output):
+            - No file list, no directory list, no job header, no % progress
+            - Robocopy otherwise formats a line for every file and folder,
+              which dominates run time on large OneDrive trees
+            - /NFL and /NDL are dropped when verbose=True so every copied
+              file and folder is listed
+            - The job summary (/NJS is NOT used) is still printed
+        
+        /BYTES (Exact sizes):
+            - Sizes in the job summary are plain byte counts instead of
+              rounded "1.2 g" style values
+            - The copied byte count is read back from the summary, so the
+              backup's size is known without walking the new snapshot
+        
+        /MT:N (Multithreaded):
+            - Copies with N parallel threads (default: CPU count, 8-32)
+            - A single thread leaves most of the disk queue idle on
+              OneDrive trees with many small files
+            - 8-16 threads suit SSD targets; 4-8 suit HDD targets
+        
+        /J (Unbuffered I/O, only with large_files=True):
+            - Bypasses the Windows cache manager
+            - Recommended for very large files (video, ISO, archives) where
+              caching just double-buffers the data
+            - Slower for small files, so it is opt-in
+        
+        /XC /XN /XO (Keep existing files, only with keep_existing=True):
+            - Never overwrite a file that already exists in dst
+            - Files hard-linked from the previous backup share their data
+              with it, so overwriting one in place would silently change
+              the previous backup too
+            - /MIR still copies missing files and purges deleted ones
     
     Exit Code Interpretation:
         0: No files copied, no errors (already in sync)
@@ -581,128 +694,762 @@ def run_robocopy(src: Path, dst: Path) -> int:
     Example:
         >>> src = Path("C:/Users/John/OneDrive")
         >>> dst = Path("D:/Backup/2025-01-15_09-00")
-        >>> result = run_robocopy(src, dst)
-        Running: robocopy C:/Users/John/OneDrive D:/Backup/2025-01-15_09-00 /MIR /FFT /R:1 /W:1
-        ... (robocopy output) ...
-        >>> print(f"Exit code: {result}")
-        Exit code: 1
+        >>> result, copied = run_robocopy(src, dst)
+        Running: robocopy C:/Users/John/OneDrive D:/Backup/2025-01-15_09-00 /MIR /FFT /COPY:DAT /R:1 /W:1 /NJH /NP /BYTES /MT:16 /NFL /NDL
+        ... (robocopy summary) ...
+        >>> print(f"Exit code: {result}, bytes copied: {copied}")
+        Exit code: 1, bytes copied: 1048576
     
     Note:
         - Creates destination directory if it doesn't exist
         - Prints the exact command for transparency
-        - Captures and displays robocopy output
-        - Shows errors to stderr if exit code >= 8
+        - Streams robocopy's output (job summary) as raw bytes
+        - Robocopy reports copy errors on stdout; its stderr is only read
+          in verbose mode
+        - Reports the failing exit code to stderr if exit code >= 8
     """
     # Ensure destination directory exists before running robocopy
     dst.mkdir(parents=True, exist_ok=True)
     
     # Build the robocopy command with our chosen options
-    cmd = [
-        "robocopy",
-        str(src),      # Source directory
-        str(dst),      # Destination directory  
-        "/MIR",        # Mirror source to destination
-        "/FFT",        # Use FAT file time (2-second precision)
-        "/R:1",        # Retry once on failure
-        "/W:1",        # Wait 1 second between retries
-    ]
+    cmd = _robocopy_command(src, dst, threads, verbose, large_files, keep_existing, recurse)
     
     # Print the command for transparency and debugging
     # Users can see exactly what command is being run
     print("\nRunning:", " ".join(cmd))
     
-    # Execute robocopy and capture output
-    completed = subprocess.run(cmd, capture_output=True, text=True)
-    
-    # Always show robocopy's standard output (file listing, summary)
-    print(completed.stdout)
-    
-    # Show error output only if there was a serious error (code >= 8)
-    if completed.returncode >= 8:
-        print(completed.stderr, file=sys.stderr)
-    
-    return completed.returncode
-
-def prune_old_backups(root: Path, retention_days: int) -> None:
+    # Execute robocopy and stream its output as it is produced
+    # Only one chunk is held in memory at a time, and progress shows up
+    # immediately instead of after the whole copy has finished
+    # stderr is discarded unless verbose (then merged into the stream)
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                            stderr=subprocess.STDOUT if verbose else subprocess.DEVNULL)
+    
+    # Pass the raw bytes straight through to our stdout
+    # Robocopy already writes in the console code page, so decoding and
+    # re-encoding every line (text=True) is pure overhead in verbose runs
+    # read1 returns whatever is available, so output is not held back
+    # The lock keeps chunks from parallel robocopy runs from interleaving
+    sys.stdout.flush()  # Keep "Running: ..." ahead of robocopy's output
+    # Only the end of the output is kept, for the job summary's byte count
+    out = sys.stdout.buffer
+    tail = b""
+    for chunk in iter(lambda: proc.stdout.read1(65536), b""):
+        with _OUTPUT_LOCK:
+            out.write(chunk)
+            out.flush()
+        tail = (tail + chunk)[-_ROBOCOPY_TAIL_BYTES:]
+    returncode = proc.wait()
+    
+    # Report a serious error (code >= 8); details are in robocopy's output above
+    if returncode >= 8:
+        print(f"robocopy failed with exit code {returncode}.", file=sys.stderr)
+    
+    return returncode, _robocopy_copied_bytes(tail)
+
+def run_robocopy_parallel(
+    src: Path,
+    dst: Path,
+    threads: int = DEFAULT_THREADS,
+    verbose: bool = False,
+    large_files: bool = False,
+    keep_existing: bool = False,
+    workers: int = PARALLEL_COPY_WORKERS
+) -> Tuple[int, Optional[int]]:
     """
-    Delete backup folders older than the retention period.
+    Mirror `src` to `dst` with one robocopy process per top-level folder.
     
-    This function safely removes only the dated backup folders created by this
-    script, identified by their YYYY-MM-DD_HH-MM naming pattern. It will never
-    delete folders with different naming patterns, protecting any user data
-    that might be in the backup root.
+    A single robocopy walks the directory tree with one thread, even with
+    /MT, which becomes the bottleneck on deep OneDrive trees. Running one
+    robocopy per top-level folder walks several subtrees at once.
     
     Args:
-        root (Path): The backup root directory containing dated folders.
-        retention_days (int): Number of days of backups to keep.
-    
-    Pruning Logic:
-        1. Calculate cutoff date (now - retention_days)
-        2. Scan all folders in backup root
-        3. Check if folder name matches our date pattern
-        4. Parse the date from folder name
-        5. Delete if folder date is before cutoff
+        src (Path): Source path (OneDrive folder) to copy from.
+        dst (Path): Destination path (backup folder) to copy to.
+        threads (int, optional): Total robocopy copy threads, shared out
+                                evenly between the concurrent processes.
+        verbose (bool, optional): Passed to run_robocopy.
+        large_files (bool, optional): Passed to run_robocopy.
+        keep_existing (bool, optional): Passed to run_robocopy.
+        workers (int, optional): Max robocopy processes at once.
+                                Defaults to PARALLEL_COPY_WORKERS.
     
-    Safety Features:
-        - Only touches folders matching YYYY-MM-DD_HH-MM pattern
-        - Ignores any files (only processes directories)
-        - Handles parse errors gracefully
-        - Uses ignore_errors=True to continue even if deletion fails
+    Returns:
+        Tuple[int, Optional[int]]: The robocopy exit codes of all runs OR-ed
+            together (exit codes are bit flags, so the result is >= 8 if any
+            run failed, just like a single /MIR run), and the bytes copied by
+            all runs (None if any run's summary couldn't be read).
     
-    Example:
-        Given retention_days=7 and current date 2025-01-15:
-        
-        D:\\Backup\\
-            2025-01-07_09-00\\  # 8 days old - will be deleted
-            2025-01-08_09-00\\  # 7 days old - will be deleted  
-            2025-01-09_09-00\\  # 6 days old - kept
-            2025-01-15_09-00\\  # today - kept
-            MyImportantData\\   # doesn't match pattern - ignored
+    Process:
+        1. One top-level run (recurse=False) copies the files directly in src
+           and purges folders that were deleted from OneDrive
+        2. Every top-level folder is then mirrored by its own robocopy, up to
+           `workers` at a time
     
     Note:
-        - Cutoff is calculated as days, not hours (time component ignored)
-        - Deletion errors are suppressed to ensure process continues
-        - Prints each folder being deleted for audit trail
-        - Silent if no folders need pruning
+        - Threads (not processes) drive the runs; each only waits on its
+          robocopy child, which does the actual work
+        - Junctions at the top level are followed, like robocopy /MIR does
+        - Falls back to a single run_robocopy if src can't be listed
+        - Job summaries of the runs are printed one after another as they
+          finish, so there is one summary per folder
     """
-    # Calculate the cutoff date/time
-    # Folders older than this will be deleted
-    cutoff = dt.datetime.now() - dt.timedelta(days=retention_days)
+    # Step 1: Top-level files, and purge folders no longer in OneDrive
+    rc, copied = run_robocopy(src, dst, threads, verbose, large_files, keep_existing, recurse=False)
+    if rc >= 8:
+        return rc, copied
+    
+    # Step 2: One robocopy per top-level folder
+    try:
+        with os.scandir(src) as entries:
+            children = [entry.name for entry in entries if entry.is_dir()]
+    except OSError:
+        return run_robocopy(src, dst, threads, verbose, large_files, keep_existing)
+    if not children:
+        return rc, copied
+    
+    # Split the /MT budget so N processes don't run N times the threads
+    jobs = min(workers, len(children))
+    per_job = max(1, threads // jobs)
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        codes = pool.map(
+            lambda name: run_robocopy(src / name, dst / name, per_job, verbose,
+                                      large_files, keep_existing),
+            children,
+        )
+        for code, job_copied in codes:
+            rc |= code
+            copied = None if copied is None or job_copied is None else copied + job_copied
+    return rc, copied
+
+def find_previous_snapshot(root: Path, before_name: str) -> Optional[Path]:
+    """
+    Find the newest dated backup folder older than `before_name`.
     
-    # Iterate through all items in the backup root
-    for child in root.iterdir():
-        # Only process directories that match our naming pattern
-        if child.is_dir() and STAMP_RE.match(child.name):
+    Args:
+        root (Path): The backup root directory containing dated folders.
+        before_name (str): Stamp of the backup being created (YYYY-MM-DD_HH-MM).
+    
+    Returns:
+        Optional[Path]: The newest dated folder whose name sorts before
+                        `before_name`, or None if there is none.
+    
+    Note:
+        - Stamps sort chronologically, so this is a max() over names
+        - Uses the same name/dir checks as prune_old_backups
+    """
+    newest = None
+    with os.scandir(root) as entries:
+        for entry in entries:
+            name = entry.name
+            if not is_stamp_name(name) or name >= before_name:
+                continue
+            if entry.is_dir(follow_symlinks=False) and (newest is None or name > newest.name):
+                newest = entry
+    return Path(newest.path) if newest is not None else None
+
+def hardlink_unchanged(src: Path, prev: Path, dst: Path) -> Tuple[int, int]:
+    """
+    Pre-seed a new backup with hard links to unchanged files of the previous one.
+    
+    Walks `src` and `prev` side by side. Every regular file whose size and
+    modification time are identical in both is hard-linked from `prev` into
+    the same relative location in `dst`. Robocopy then sees those files as
+    already up to date and only copies new or changed files.
+    
+    Args:
+        src (Path): Source tree (the OneDrive folder or its shadow copy).
+        prev (Path): Previous dated backup folder.
+        dst (Path): New dated backup folder (created as needed).
+    
+    Returns:
+        Tuple[int, int]: (number of files hard-linked, their total size in bytes).
+    
+    Note:
+        - Only exact matches (size and st_mtime_ns) are linked, which is
+          stricter than robocopy's /FFT 2-second comparison, so robocopy
+          never decides a linked file needs recopying
+        - Subtrees missing from `prev` are skipped without being walked
+        - A file that can't be linked (e.g., NTFS's 1023-links-per-file
+          limit) is simply left for robocopy to copy
+        - DirEntry.stat() is served from the directory listing on Windows,
+          so the walk costs no per-file stat calls
+    """
+    linked = 0
+    linked_bytes = 0
+    
+    # Iterative walk over (source dir, previous-backup dir, new-backup dir),
+    # kept as plain strings: joining with os.path.join costs no Path object
+    # per directory and file
+    stack = [(os.fspath(src), os.fspath(prev), os.fspath(dst))]
+    while stack:
+        src_dir, prev_dir, dst_dir = stack.pop()
+        
+        # Index the previous backup's entries in this directory by name
+        try:
+            with os.scandir(prev_dir) as it:
+                prev_entries = {entry.name: entry for entry in it}
+            src_entries = list(os.scandir(src_dir))
+        except OSError:
+            continue
+        
+        dst_made = False
+        for entry in src_entries:
+            old = prev_entries.get(entry.name)
+            if old is None:
+                continue
             try:
-                # Parse the timestamp from the folder name
-                # Format: YYYY-MM-DD_HH-MM
-                d = dt.datetime.strptime(child.name, "%Y-%m-%d_%H-%M")
-            except ValueError:
-                # Name looked like our pattern but didn't parse correctly
-                # Skip this folder defensively (don't delete what we don't understand)
+                # Recurse into directories that exist in both trees
+                if entry.is_dir(follow_symlinks=False):
+                    if old.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, old.path, os.path.join(dst_dir, entry.name)))
+                    continue
+                
+                # Only regular files that are byte-for-byte metadata identical
+                if not entry.is_file(follow_symlinks=False) or not old.is_file(follow_symlinks=False):
+                    continue
+                cur_st, old_st = entry.stat(follow_symlinks=False), old.stat(follow_symlinks=False)
+                if cur_st.st_size != old_st.st_size or cur_st.st_mtime_ns != old_st.st_mtime_ns:
+                    continue
+                
+                # Create the destination folder only once something is linked
+                if not dst_made:
+                    os.makedirs(dst_dir, exist_ok=True)
+                    dst_made = True
+                os.link(old.path, os.path.join(dst_dir, entry.name))
+                linked += 1
+                linked_bytes += cur_st.st_size
+            except OSError:
+                # Leave this file for robocopy to copy normally
+                continue
+    
+    return linked, linked_bytes
+
+def _tree_size(root: Path) -> int:
+    """
+    Total size in bytes of all regular files under `root`.
+    
+    Args:
+        root (Path): Directory tree to measure.
+    
+    Returns:
+        int: Sum of file sizes (unreadable folders are skipped).
+    
+    Note:
+        - Uses os.scandir; on Windows DirEntry.stat() comes from the
+          directory listing, so no per-file stat calls are made
+        - Symlinks are not followed
+    """
+    total = 0
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(Path(entry.path))
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+    return total
+
+def read_last_backup_size(backup_root: Path) -> Optional[int]:
+    """
+    Read the byte count recorded by the previous successful backup.
+    
+    Args:
+        backup_root (Path): Root directory where backups are stored.
+    
+    Returns:
+        Optional[int]: Bytes written by the last backup, or None if unknown.
+    """
+    try:
+        return int((backup_root / LAST_SIZE_FILE).read_text(encoding="ascii").strip())
+    except (OSError, ValueError):
+        return None
+
+def write_last_backup_size(backup_root: Path, size: int) -> None:
+    """
+    Record how many bytes this backup wrote, for the next run's space check.
+    
+    Args:
+        backup_root (Path): Root directory where backups are stored.
+        size (int): Bytes written by this backup.
+    
+    Note:
+        - Best-effort; a failed write only disables the next pre-check
+    """
+    with contextlib.suppress(OSError):
+        (backup_root / LAST_SIZE_FILE).write_text(str(size), encoding="ascii")
+
+def has_space_for_backup(backup_root: Path) -> bool:
+    """
+    Check whether the backup drive can hold another backup like the last one.
+    
+    Args:
+        backup_root (Path): Root directory where backups are stored.
+    
+    Returns:
+        bool: False only if free space is known to be below the last backup's
+              size times DISK_SPACE_MARGIN; True otherwise (including the
+              first run, when no size has been recorded yet).
+    """
+    last_size = read_last_backup_size(backup_root)
+    if last_size is None:
+        return True
+    return shutil.disk_usage(backup_root).free >= last_size * DISK_SPACE_MARGIN
+
+def query_usn_journal(volume: str) -> Optional[str]:
+    """
+    Read the current position of a volume's NTFS change (USN) journal.
+    
+    NTFS appends a record to the journal for every change on the volume, so
+    if the journal ID and "Next Usn" are the same as before, nothing on the
+    volume - and so nothing in OneDrive - has changed in between. Comparing
+    them costs one fsutil call instead of robocopy scanning the whole tree.
+    
+    Args:
+        volume (str): Volume root, e.g. "C:\\".
+    
+    Returns:
+        Optional[str]: "<volume> <journal id> <next usn>", only meant to be
+                       compared for equality, or None if the journal could
+                       not be read.
+    
+    Note:
+        - Requires Administrator rights (scheduled tasks run at HIGHEST)
+        - Any failure (no journal, not NTFS, network path, localized fsutil
+          output) returns None, which simply means "assume changed"
+        - The position covers the whole volume, so the check is conservative:
+          any change anywhere on the volume counts as a change. On the system
+          drive (where OneDrive usually is) something changes almost every
+          second, which is why run_once only asks with skip_unchanged
+    """
+    try:
+        res = subprocess.run(["fsutil", "usn", "queryjournal", volume.rstrip("\\")],
+                             capture_output=True, text=True)
+    except OSError:
+        # fsutil not available (non-Windows)
+        return None
+    if res.returncode != 0:
+        return None
+    
+    # Output is "Key : Value" lines, e.g. "Next Usn          : 0x0000000012345678"
+    fields = {}
+    for line in res.stdout.splitlines():
+        key, sep, value = line.partition(":")
+        if sep:
+            fields[key.strip()] = value.strip()
+    journal_id = fields.get("Usn Journal ID")
+    next_usn = fields.get("Next Usn")
+    if not journal_id or not next_usn:
+        return None
+    return f"{volume} {journal_id} {next_usn}"
+
+def read_last_usn(backup_root: Path) -> Optional[Tuple[str, str]]:
+    """
+    Read the journal position recorded by the previous successful backup.
+    
+    Args:
+        backup_root (Path): Root directory where backups are stored.
+    
+    Returns:
+        Optional[Tuple[str, str]]: (backup folder name, query_usn_journal()
+                                   result), or None if nothing was recorded.
+    """
+    try:
+        lines = (backup_root / LAST_USN_FILE).read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return None
+    if len(lines) != 2:
+        return None
+    return lines[0], lines[1]
+
+def write_last_usn(backup_root: Path, stamp: str, usn_state: str) -> None:
+    """
+    Record the journal position taken just before a successful backup.
+    
+    Args:
+        backup_root (Path): Root directory where backups are stored.
+        stamp (str): Name of the dated folder that backup created.
+        usn_state (str): query_usn_journal() result from before the copy.
+    
+    Note:
+        - Best-effort; a failed write only means the next run copies normally
+    """
+    with contextlib.suppress(OSError):
+        (backup_root / LAST_USN_FILE).write_text(f"{stamp}\n{usn_state}\n", encoding="utf-8")
+
+# SHFileOperationW constants (shellapi.h)
+_FO_DELETE = 0x0003
+_FOF_SILENT = 0x0004           # No progress dialog
+_FOF_NOCONFIRMATION = 0x0010   # Answer "Yes to all"
+_FOF_NOERRORUI = 0x0400        # No error dialogs
+# FOF_ALLOWUNDO is deliberately NOT set: snapshots must not go to the Recycle Bin
+
+# cmd.exe rejects command lines over 8191 characters; batched rmdir calls stay below this
+_CMD_MAX_CHARS = 8000
+
+def _shell_delete(path: Path) -> bool:
+    """
+    Delete a directory tree with the Windows Shell API (SHFileOperationW).
+    
+    This is the same native tree delete Explorer uses; the whole walk and
+    every unlink happen inside shell32 instead of in Python.
+    
+    Args:
+        path (Path): Directory tree to remove.
+    
+    Returns:
+        bool: True if shell32 reported success, False if it failed or is not
+              available (non-Windows).
+    
+    Note:
+        - Never shows UI (silent, no confirmation, no error dialogs)
+        - pFrom must be an absolute, double-null-terminated path
+    """
+    # Imported here: only pruning needs ctypes, headless copies don't
+    import ctypes
+    
+    # ctypes.windll only exists on Windows
+    if not hasattr(ctypes, "windll"):
+        return False
+    from ctypes import wintypes
+    
+    class SHFILEOPSTRUCTW(ctypes.Structure):
+        # shellapi.h packs this struct to 1 byte on 32-bit Windows only
+        _pack_ = 1 if ctypes.sizeof(ctypes.c_void_p) == 4 else 8
+        _fields_ = [
+            ("hwnd", wintypes.HWND),
+            ("wFunc", wintypes.UINT),
+            ("pFrom", wintypes.LPCWSTR),
+            ("pTo", wintypes.LPCWSTR),
+            ("fFlags", wintypes.WORD),
+            ("fAnyOperationsAborted", wintypes.BOOL),
+            ("hNameMappings", wintypes.LPVOID),
+            ("lpszProgressTitle", wintypes.LPCWSTR),
+        ]
+    
+    # create_unicode_buffer adds one terminator, the explicit "\0" the second
+    source = ctypes.create_unicode_buffer(os.path.abspath(path) + "\0")
+    op = SHFILEOPSTRUCTW(
+        wFunc=_FO_DELETE,
+        pFrom=ctypes.cast(source, wintypes.LPCWSTR),
+        fFlags=_FOF_SILENT | _FOF_NOCONFIRMATION | _FOF_NOERRORUI,
+    )
+    try:
+        return ctypes.windll.shell32.SHFileOperationW(ctypes.byref(op)) == 0 and not op.fAnyOperationsAborted
+    except OSError:
+        return False
+
+def _batched_rmdir(paths: List[Path]) -> None:
+    """
+    Delete several directory trees with as few cmd.exe processes as possible.
+    
+    Each cmd.exe start costs a process launch, so instead of one
+    "cmd /c rmdir" per folder the commands are chained with "&" into one
+    command line, split only where it would exceed _CMD_MAX_CHARS.
+    
+    Args:
+        paths (List[Path]): Directory trees to remove.
+    
+    Note:
+        - "&" (not "&&") so a folder that fails doesn't stop the rest
+        - The command line is passed as a string: cmd.exe does its own
+          parsing and doesn't understand the backslash-escaped quotes
+          subprocess would produce from an argument list
+        - Paths containing "%" are skipped (left for the caller's
+          shutil.rmtree pass): cmd.exe expands %VAR% even inside double
+          quotes, so "rmdir /S /Q" could delete a different folder
+        - Best-effort; does nothing if cmd.exe isn't available (non-Windows)
+    """
+    # /S removes the whole tree, /Q suppresses the confirmation prompt
+    targets = (os.path.abspath(p) for p in paths)
+    commands = [f'rmdir /S /Q "{target}"' for target in targets if "%" not in target]
+    if not commands:
+        return
+    
+    # Group the commands into command lines below the length limit
+    batches: List[List[str]] = [[]]
+    length = 0
+    for command in commands:
+        if batches[-1] and length + len(command) + 3 > _CMD_MAX_CHARS:
+            batches.append([])
+            length = 0
+        batches[-1].append(command)
+        length += len(command) + 3  # + len(" & ")
+    
+    for batch in batches:
+        try:
+            subprocess.run("cmd /c " + " & ".join(batch),
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        except OSError:
+            # cmd.exe not available (non-Windows) - caller falls back to Python
+            return
+
+def _fast_rmtrees(paths: List[Path]) -> None:
+    """
+    Delete directory trees using native Windows code.
+    
+    shutil.rmtree walks the tree in Python and issues one unlink/rmdir per
+    entry, which is very slow on snapshots with hundreds of thousands of
+    files. SHFileOperationW (see _shell_delete) performs the same delete
+    natively in shell32, with "rmdir /S /Q" in cmd.exe as a second native try.
+    
+    Args:
+        paths (List[Path]): Directory trees to remove.
+    
+    Process:
+        1. Shell delete every tree, up to PRUNE_MAX_WORKERS at a time
+           (threads are enough because the work happens in native code)
+        2. Trees left behind go to a single batched cmd.exe rmdir pass
+           (see _batched_rmdir)
+        3. Anything still left is removed with shutil.rmtree
+    
+    Note:
+        - Falls back to shutil.rmtree if no native delete is available
+          (non-Windows) or the native deletes leave the folder behind
+          (e.g., locked files)
+        - Errors are suppressed, matching the previous ignore_errors=True
+    """
+    if not paths:
+        return
+    
+    # Fast path: one shell32 call per tree, several trees at once
+    with ThreadPoolExecutor(max_workers=min(PRUNE_MAX_WORKERS, len(paths))) as pool:
+        list(pool.map(_shell_delete, paths))
+    
+    # Second native try for whatever is left, in as few processes as possible
+    left = [p for p in paths if p.exists()]
+    if left:
+        _batched_rmdir(left)
+    
+    # Anything left over is removed the slow way, still best-effort
+    for p in left:
+        if p.exists():
+            shutil.rmtree(p, ignore_errors=True)
+
+def _expired_backups(root: Path, retention_days: int) -> List[Path]:
+    """
+    List the dated backup folders in `root` that prune_old_backups deletes.
+    
+    Args:
+        root (Path): The backup root directory containing dated folders.
+        retention_days (int): Number of days of backups to keep.
+    
+    Returns:
+        List[Path]: Dated folders older than the cutoff, never including the
+                    newest dated folder (see prune_old_backups).
+    
+    Note:
+        One scandir of the backup root, so it doubles as a cheap "anything
+        to prune?" check (see _exec_robocopy)
+    """
+    # Calculate the cutoff date/time once, formatted like our folder names
+    # Folders whose name sorts before this will be deleted
+    # STAMP_FMT is shared with timestamp_stamp, so the string comparison
+    # below can never drift out of step with the folder names
+    cutoff = dt.datetime.now() - dt.timedelta(days=retention_days)
+    cutoff_str = cutoff.strftime(STAMP_FMT)
+    
+    # Expired snapshots, collected first so they can be deleted in parallel
+    victims: List[Path] = []
+    
+    # Newest dated folder seen so far; it is never pruned
+    newest = ""
+    
+    # Iterate through all items in the backup root
+    # os.scandir reports each entry's type from the directory listing itself,
+    # so no extra stat call is needed per entry (unlike Path.iterdir + is_dir)
+    with os.scandir(root) as entries:
+        for entry in entries:
+            # Only process real directories that match our naming pattern
+            name = entry.name
+            if not is_stamp_name(name):
+                continue
+            if not entry.is_dir(follow_symlinks=False):
                 continue
+            newest = max(newest, name)
             
             # Check if this backup is older than our retention cutoff
-            if d < cutoff:
-                # Log the deletion for audit purposes
-                print(f"Pruning old backup: {child}")
-                
-                # Remove the entire directory tree
-                # ignore_errors=True ensures we continue even if some files are locked
-                shutil.rmtree(child, ignore_errors=True)
+            # YYYY-MM-DD_HH-MM sorts chronologically, so a plain string
+            # comparison replaces parsing the folder name into a datetime
+            if name < cutoff_str:
+                # Only build a Path for folders we actually delete
+                victims.append(Path(entry.path))
+    
+    # Keep the newest backup no matter how old it is (it is only a victim
+    # when every backup has expired)
+    return [child for child in victims if child.name != newest]
 
-def run_once(backup_root: Path, retention_days: int) -> int:
+def prune_old_backups(root: Path, retention_days: int) -> None:
+    """
+    Delete backup folders older than the retention period.
+    
+    This function safely removes only the dated backup folders created by this
+    script, identified by their YYYY-MM-DD_HH-MM naming pattern. It will never
+    delete folders with different naming patterns, protecting any user data
+    that might be in the backup root.
+    
+    Args:
+        root (Path): The backup root directory containing dated folders.
+        retention_days (int): Number of days of backups to keep.
+    
+    Pruning Logic:
+        1. Calculate cutoff date (now - retention_days) as a stamp string
+        2. Scan all folders in backup root
+        3. Check if folder name matches our date pattern
+        4. Compare the folder name to the cutoff stamp (stamps sort
+           lexicographically in chronological order, so no parsing needed)
+        5. Collect folders dated before cutoff, except the newest dated
+           folder overall, which is always kept
+        6. Delete them in parallel (up to PRUNE_MAX_WORKERS at a time,
+           which is never more than the CPU count)
+    
+    Safety Features:
+        - Only touches folders matching YYYY-MM-DD_HH-MM pattern
+        - Ignores any files (only processes directories)
+        - Ignores symlinks/junctions to directories (never follows them)
+        - Never deletes the newest backup, even if it is older than the
+          retention period (e.g., after a long time without backups or
+          after lowering retention), so at least one backup always remains
+        - Continues even if deletion fails (best-effort native delete)
+    
+    Example:
+        Given retention_days=7 and current date 2025-01-15:
+        
+        D:\\Backup\\
+            2025-01-07_09-00\\  # 8 days old - will be deleted
+            2025-01-08_09-00\\  # 7 days old - will be deleted  
+            2025-01-09_09-00\\  # 6 days old - kept
+            2025-01-15_09-00\\  # today - kept
+            MyImportantData\\   # doesn't match pattern - ignored
+    
+    Note:
+        - Cutoff is calculated as days, not hours (time component ignored)
+        - Deletion errors are suppressed to ensure process continues
+        - Prints each folder being deleted for audit trail
+        - Silent if no folders need pruning
+    """
+    # Expired snapshots (never the newest), collected first so they can be
+    # deleted in parallel
+    victims = _expired_backups(root, retention_days)
+    
+    # Silent if nothing expired
+    if not victims:
+        return
+    
+    # Log the deletions for audit purposes
+    for child in victims:
+        print(f"Pruning old backup: {child}")
+    
+    # Remove the directory trees natively (see _fast_rmtrees), several at once
+    # Errors are ignored so we continue even if some files are locked
+    _fast_rmtrees(victims)
+
+def spawn_detached_prune(backup_root: Path, retention_days: int) -> None:
+    """
+    Start a detached "--prune-only" copy of this script.
+    
+    Headless runs use this so the Scheduled Task finishes as soon as
+    robocopy does, instead of waiting for old snapshots to be deleted.
+    
+    Args:
+        backup_root (Path): Root directory where backups are stored.
+        retention_days (int): Number of days of backups to retain.
+    
+    Note:
+        - The child has no console; its output is discarded
+        - Falls back to pruning in-process if the child can't be started
+    """
+    cmd = [
+        _PYTHON_EXE, str(_script_path()),
+        "--prune-only",
+        "--backup-root", str(backup_root),
+        "--retention-days", str(retention_days),
+    ]
+    
+    # Detach from our console and process group (Windows-only flags)
+    flags = getattr(subprocess, "DETACHED_PROCESS", 0) | getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0)
+    breakaway = getattr(subprocess, "CREATE_BREAKAWAY_FROM_JOB", 0)
+    
+    # Try to break away from the Task Scheduler job first; some job objects
+    # forbid that, so retry without it before giving up
+    for creationflags in (flags | breakaway, flags):
+        try:
+            subprocess.Popen(cmd, creationflags=creationflags, close_fds=True,
+                             stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                             stderr=subprocess.DEVNULL)
+            return
+        except OSError:
+            continue
+    
+    # Couldn't spawn - prune synchronously so retention is still enforced
+    prune_old_backups(backup_root, retention_days)
+
+def _start_prune(backup_root: Path, retention_days: int, detach_prune: bool) -> None:
+    """
+    Start pruning expired backups without waiting for it to finish.
+    
+    Args:
+        backup_root (Path): Root directory where backups are stored.
+        retention_days (int): Number of days of backups to retain.
+        detach_prune (bool): Prune in a detached "--prune-only" process if
+                             True, in a non-daemon thread otherwise.
+    """
+    if detach_prune:
+        spawn_detached_prune(backup_root, retention_days)
+    else:
+        threading.Thread(target=prune_old_backups, args=(backup_root, retention_days),
+                         daemon=False).start()
+
+def run_once(
+    backup_root: Union[str, Path],
+    retention_days: int,
+    threads: int = DEFAULT_THREADS,
+    detach_prune: bool = False,
+    verbose: bool = False,
+    large_files: bool = False,
+    use_vss: bool = False,
+    incremental: bool = DEFAULT_INCREMENTAL,
+    parallel_subtrees: bool = False,
+    skip_unchanged: bool = False
+) -> int:
     """
     Execute a complete backup cycle.
     
     This is the main backup logic that:
     1. Verifies OneDrive exists
     2. Creates a new timestamped backup
-    3. Prunes old backups if successful
+    3. Prunes old backups in the background if successful
     
     Args:
-        backup_root (Path): Root directory where backups are stored.
+        backup_root (Union[str, Path]): Root directory where backups are stored.
         retention_days (int): Number of days of backups to retain.
+        threads (int, optional): Robocopy copy threads (/MT:N).
+        detach_prune (bool, optional): If True, prune in a detached
+                                      "--prune-only" process so the caller
+                                      can exit immediately (headless runs).
+                                      If False, prune in a background thread.
+        verbose (bool, optional): Also show robocopy's stderr output.
+        large_files (bool, optional): Use robocopy unbuffered I/O (/J).
+        use_vss (bool, optional): Copy from a VSS shadow copy of the OneDrive
+                                 volume instead of the live folder.
+        incremental (bool, optional): Hard-link files unchanged since the
+                                     previous dated backup instead of
+                                     copying them again.
+        parallel_subtrees (bool, optional): Copy each top-level OneDrive
+                                           folder with its own robocopy
+                                           (see run_robocopy_parallel).
+        skip_unchanged (bool, optional): Skip the copy (and only prune) when
+                                        the OneDrive volume's change journal
+                                        has not moved since the last backup
+                                        (see query_usn_journal). Opt-in: the
+                                        journal is volume-wide, so it only
+                                        pays off when OneDrive is on a volume
+                                        of its own; on the system drive it
+                                        just costs an fsutil call per run.
     
     Returns:
         int: Exit code (0 for success, >0 for errors).
@@ -710,20 +1457,28 @@ def run_once(backup_root: Path, retention_days: int) -> int:
     Process Flow:
         1. Resolve OneDrive path from environment
         2. Verify OneDrive directory exists
-        3. Create backup root if needed
-        4. Generate new timestamped folder name
-        5. Run robocopy to mirror OneDrive
-        6. If successful (code < 8), prune old backups
-        7. Return appropriate exit code
+        3. Create backup root if needed; if the OneDrive volume's change
+           journal hasn't moved since the last backup, skip the copy (the
+           last backup is still current) and only prune
+        4. Check the backup drive has enough free space
+        5. Generate new timestamped folder name
+        6. If incremental, hard-link unchanged files from the previous backup
+        7. Run robocopy to mirror OneDrive (from a shadow copy if use_vss)
+        8. If successful (code < 8), start pruning old backups
+        9. Return appropriate exit code without waiting for the prune
     
     Error Handling:
         - Returns 1 if OneDrive path doesn't exist
+        - Returns 1 if the backup drive lacks room for a backup the size of
+          the last one, even after pruning expired backups early
+        - Returns 1 if this minute's dated folder already exists (two runs
+          in the same minute); the existing backup is left untouched
         - Returns robocopy exit code if >= 8 (serious error)
         - Only prunes if backup was successful
     
     Example:
         >>> result = run_once(Path("D:/Backup"), 30)
-        Running: robocopy C:/Users/John/OneDrive D:/Backup/2025-01-15_09-30 /MIR /FFT /R:1 /W:1
+        Running: robocopy C:/Users/John/OneDrive D:/Backup/2025-01-15_09-30 /MIR /FFT /COPY:DAT /R:1 /W:1 ... /MT:16
         ... (robocopy output) ...
         Pruning old backup: D:/Backup/2024-12-15_09-00
         >>> print(result)
@@ -732,31 +1487,109 @@ def run_once(backup_root: Path, retention_days: int) -> int:
     Note:
         - Creates all necessary directories automatically
         - Timestamp includes minutes for multiple daily runs
+        - The unchanged-skip needs Administrator rights (to read the change
+          journal) and the last backup folder to still exist; otherwise the
+          copy always runs
         - Pruning only happens after successful backup
+        - There is deliberately no persistent "_mirror" folder updated with
+          /XO and then snapshotted: robocopy rewrites changed files in place,
+          which would also rewrite every snapshot hard-linked to the mirror.
+          Hard-linking from the previous dated folder and copying under
+          /XC /XN /XO (keep_existing) gives robocopy the same unchanged-file
+          skip while every dated folder stays immutable
+        - The prune thread is non-daemon, so the interpreter still waits
+          for it to finish before exiting
         - All output goes to stdout except errors
     """
     # Step 1: Resolve and verify OneDrive path
+    # os.path.isdir is a single attribute query (GetFileAttributesExW), and
+    # also rejects a plain file where the folder should be
     src = onedrive_path()
-    if not src.exists():
+    if not os.path.isdir(src):
         # OneDrive directory not found - can't proceed
         print(f"OneDrive path not found: {src}", file=sys.stderr)
         return 1
 
     # Step 2: Ensure backup root directory exists
     # Create full path including parents if needed
-    backup_root.mkdir(parents=True, exist_ok=True)
+    # Usually it already exists, and a read-only attribute check is cheaper
+    # than a CreateDirectoryW that fails with "already exists"
+    if not os.path.isdir(backup_root):
+        os.makedirs(backup_root, exist_ok=True)
+    # Headless runs pass the command-line string straight through; the one
+    # Path is made here, where the state files and dated folder are joined on
+    backup_root = Path(backup_root)
+    
+    # Opt-in (--skip-unchanged): nothing changed on the OneDrive volume since
+    # the last backup started, so that backup is still an exact copy; skip
+    # robocopy's full-tree scan (common for HOURLY/MINUTE schedules) and only
+    # prune. The journal is volume-wide, so this is left off by default
+    usn_state = query_usn_journal(src.anchor) if skip_unchanged else None
+    last_usn = read_last_usn(backup_root) if usn_state is not None else None
+    if (last_usn is not None and last_usn[1] == usn_state
+            and os.path.isdir(backup_root / last_usn[0])):
+        print(f"\nOneDrive unchanged since backup {last_usn[0]}; skipping copy.")
+        _start_prune(backup_root, retention_days, detach_prune)
+        return 0
+    
+    # Pre-flight: a full disk would make robocopy fail only after copying for
+    # minutes. If the last backup wouldn't fit, prune expired backups now
+    # (normally done afterwards) and give up if there is still not enough room
+    if not has_space_for_backup(backup_root):
+        print("Backup drive is low on space; pruning old backups first.", file=sys.stderr)
+        prune_old_backups(backup_root, retention_days)
+        if not has_space_for_backup(backup_root):
+            print(f"Not enough free space in {backup_root} for another backup "
+                  f"(last one wrote {read_last_backup_size(backup_root)} bytes). "
+                  "Free up space or lower the retention.", file=sys.stderr)
+            return 1
     
     # Step 3: Create new timestamped destination folder
     # Format: backup_root/YYYY-MM-DD_HH-MM
     dst = backup_root / timestamp_stamp()
     
+    # Stamps have minute resolution: a second run within the same minute
+    # would land in the earlier run's folder, where hard links and /XC /XN /XO
+    # (or /MIR's in-place rewrites without them) leave a mixed, stale
+    # snapshot. Refuse instead; the next run gets a new folder
+    if os.path.lexists(dst):
+        print(f"Backup folder {dst} already exists (a backup already ran this minute); "
+              "not copying into it. Try again in a minute.", file=sys.stderr)
+        return 1
+    
     # Step 4: Execute the backup using robocopy
-    rc = run_robocopy(src, dst)
+    # With use_vss, copy from a consistent point-in-time snapshot so files
+    # being synced or autosaved don't trigger retries; the live folder otherwise
+    with shadow_copy_source(src) if use_vss else contextlib.nullcontext(src) as copy_src:
+        # Incremental: link unchanged files to the previous backup first, so
+        # robocopy only has to copy what changed (proportional to the delta)
+        prev = find_previous_snapshot(backup_root, dst.name) if incremental else None
+        linked_bytes = 0
+        if prev is not None:
+            linked, linked_bytes = hardlink_unchanged(copy_src, prev, dst)
+            print(f"\nHard-linked {linked} unchanged file(s) from {prev}")
+        
+        # Linked files share data with the previous backup: never overwrite them
+        copy = run_robocopy_parallel if parallel_subtrees else run_robocopy
+        rc, copied_bytes = copy(copy_src, dst, threads, verbose, large_files, keep_existing=prev is not None)
     
     # Step 5: If backup successful, prune old backups
     # Only prune if robocopy succeeded (exit code < 8)
+    # Deleting large snapshots is slow, so it never blocks the backup result
     if rc < 8:
-        prune_old_backups(backup_root, retention_days)
+        # Remember how much new data this backup wrote (hard links are free)
+        # robocopy's own count of what it copied; only if its summary couldn't
+        # be read is the new snapshot walked instead
+        if copied_bytes is None:
+            copied_bytes = _tree_size(dst) - linked_bytes
+        write_last_backup_size(backup_root, copied_bytes)
+        
+        # Remember the journal position from before the copy, so the next
+        # run can tell whether anything changed since
+        if usn_state is not None:
+            write_last_usn(backup_root, dst.name, usn_state)
+        
+        _start_prune(backup_root, retention_days, detach_prune)
         return 0  # Return success
     
     # Backup failed - return the robocopy error code
@@ -767,15 +1600,100 @@ def run_once(backup_root: Path, retention_days: int) -> int:
 # SCHEDULED TASK MANAGEMENT
 # =============================
 
+def _task_argv(
+    script_path: Path,
+    backup_root: Path,
+    retention_days: int,
+    threads: int,
+    large_files: bool,
+    use_vss: bool,
+    incremental: bool,
+    parallel_subtrees: bool,
+    skip_unchanged: bool
+) -> List[str]:
+    """
+    Build the scheduled task's script arguments as an argv list.
+    
+    Kept as separate arguments until the last moment, so quoting is done
+    once, by subprocess.list2cmdline (see build_task_arguments).
+    """
+    # This runs our script with --headless-run flag and all necessary parameters
+    argv = [
+        str(script_path),                     # Script path
+        "--headless-run",                     # Flag for non-interactive mode
+        "--backup-root", str(backup_root),    # Where to store backups
+        "--retention-days", str(retention_days),  # How many days to keep
+        "--threads", str(threads),            # Robocopy /MT thread count
+    ]
+    if large_files:
+        argv.append("--large-files")          # Robocopy unbuffered I/O (/J)
+    if use_vss:
+        argv.append("--use-vss")              # Copy from a VSS shadow copy
+    # Always spelled out so the task keeps its behavior if the default changes
+    argv.append("--incremental" if incremental else "--full-copy")  # Hard-link unchanged files or not
+    if parallel_subtrees:
+        argv.append("--parallel-subtrees")    # One robocopy per top-level folder
+    if skip_unchanged:
+        argv.append("--skip-unchanged")       # Skip the copy if the journal hasn't moved
+    return argv
+
+def build_task_arguments(
+    script_path: Path,
+    backup_root: Path,
+    retention_days: int,
+    threads: int = DEFAULT_THREADS,
+    large_files: bool = False,
+    use_vss: bool = False,
+    incremental: bool = DEFAULT_INCREMENTAL,
+    parallel_subtrees: bool = False,
+    skip_unchanged: bool = False
+) -> str:
+    """
+    Build the arguments the scheduled task passes to the Python interpreter.
+    
+    Shared by the schtasks command (/TR) and the Task Scheduler API
+    registration (the action's Arguments), so both run the same command.
+    Quoted with subprocess.list2cmdline, the inverse of how the C runtime
+    splits a command line, so paths with spaces, embedded quotes or a
+    trailing backslash (e.g., "E:\\") reach parse_args unchanged.
+    
+    Args:
+        script_path (Path): Path to this script.
+        backup_root (Path): Backup destination root directory.
+        retention_days (int): Days of backups to retain.
+        threads (int, optional): Robocopy copy threads passed as --threads.
+        large_files (bool, optional): Pass --large-files (robocopy /J).
+        use_vss (bool, optional): Pass --use-vss (copy from a shadow copy).
+        incremental (bool, optional): Pass --incremental (hard-link snapshots)
+                                     if True, --full-copy if False.
+        parallel_subtrees (bool, optional): Pass --parallel-subtrees (one
+                                           robocopy per top-level folder).
+        skip_unchanged (bool, optional): Pass --skip-unchanged (skip the copy
+                                        when the change journal hasn't moved).
+    
+    Returns:
+        str: e.g. '"C:\\My Tools\\main.py" --headless-run --backup-root D:\\Backup --retention-days 30 ...'
+    """
+    return subprocess.list2cmdline(_task_argv(
+        script_path, backup_root, retention_days, threads, large_files, use_vss,
+        incremental, parallel_subtrees, skip_unchanged
+    ))
+
 def build_schtasks_command(
     task_name: str,
     schedule_type: str,
-    start_time_hhmm: str,
+    start_time_hhmm: Optional[str],
     modifier: int,
     python_exe: str,
     script_path: Path,
     backup_root: Path,
-    retention_days: int
+    retention_days: int,
+    threads: int = DEFAULT_THREADS,
+    large_files: bool = False,
+    use_vss: bool = False,
+    incremental: bool = DEFAULT_INCREMENTAL,
+    parallel_subtrees: bool = False,
+    skip_unchanged: bool = False
 ) -> List[str]:
     """
     Construct the Windows schtasks command to create a scheduled task.
@@ -786,12 +1704,24 @@ def build_schtasks_command(
     Args:
         task_name (str): Name for the scheduled task (shown in Task Scheduler).
         schedule_type (str): One of "DAILY", "HOURLY", or "MINUTE".
-        start_time_hhmm (str): Start time in HH:MM format.
+        start_time_hhmm (Optional[str]): Start time in HH:MM format, or None
+                              to let schtasks start from the current time.
+                              Must already be valid (see
+                              prompts.validate_time_hhmm); not re-checked.
         modifier (int): Interval modifier for HOURLY/MINUTE schedules.
         python_exe (str): Path to Python interpreter.
         script_path (Path): Path to this script.
         backup_root (Path): Backup destination root directory.
         retention_days (int): Days of backups to retain.
+        threads (int, optional): Robocopy copy threads passed as --threads.
+        large_files (bool, optional): Pass --large-files (robocopy /J).
+        use_vss (bool, optional): Pass --use-vss (copy from a shadow copy).
+        incremental (bool, optional): Pass --incremental (hard-link snapshots)
+                                     if True, --full-copy if False.
+        parallel_subtrees (bool, optional): Pass --parallel-subtrees (one
+                                           robocopy per top-level folder).
+        skip_unchanged (bool, optional): Pass --skip-unchanged (skip the copy
+                                        when the change journal hasn't moved).
     
     Returns:
         List[str]: Command line arguments for schtasks.exe.
@@ -806,67 +1736,400 @@ def build_schtasks_command(
         /RL: Run level (HIGHEST for admin privileges)
         /F: Force - overwrite existing task without prompting
     
-    Task Command Line:
-        The task will execute:
-        "python.exe" "script.py" --headless-run --backup-root "D:\\Backup" --retention-days 30
-        
-        This runs the script in headless mode (no prompts) with the specified parameters.
+    Task Command Line:
+        The task will execute:
+        python.exe script.py --headless-run --backup-root D:\\Backup --retention-days 30 --threads 16
+        
+        This runs the script in headless mode (no prompts) with the specified parameters.
+        Arguments are quoted by subprocess.list2cmdline only where needed
+        (spaces, quotes), so e.g. "C:\\Program Files\\Python\\python.exe".
+    
+    Example:
+        >>> cmd = build_schtasks_command(
+        ...     "MyBackup", "DAILY", "09:00", 1,
+        ...     "C:/Python/python.exe", Path("backup.py"),
+        ...     Path("D:/Backup"), 30
+        ... )
+        >>> print(" ".join(cmd))
+        schtasks /Create /TN MyBackup /SC DAILY /TR "..." /RL HIGHEST /F /ST 09:00
+    
+    Note:
+        - Quotes paths with spaces or quotes (subprocess.list2cmdline)
+        - Uses HIGHEST run level for file access permissions
+        - /F flag overwrites existing tasks automatically
+        - Start time included for all schedule types when one is given
+        - Memoized per settings (see _build_schtasks_command_cached)
+    """
+    # Paths become strings so the cache key is made of plain primitives;
+    # callers get their own list, the cached tuple is never handed out
+    return list(_build_schtasks_command_cached(
+        task_name, schedule_type, start_time_hhmm, modifier, python_exe,
+        str(script_path), str(backup_root), retention_days, threads, large_files,
+        use_vss, incremental, parallel_subtrees, skip_unchanged
+    ))
+
+# schtasks /Create options used by every registration, built once
+_SCHTASKS_TAIL = (
+    "/RL", "HIGHEST",  # Run with highest privileges available
+    "/F",              # Force creation (overwrite if exists)
+)
+
+@functools.lru_cache(maxsize=16)
+def _build_schtasks_command_cached(
+    task_name: str,
+    schedule_type: str,
+    start_time_hhmm: Optional[str],
+    modifier: int,
+    python_exe: str,
+    script_path: str,
+    backup_root: str,
+    retention_days: int,
+    threads: int,
+    large_files: bool,
+    use_vss: bool,
+    incremental: bool,
+    parallel_subtrees: bool,
+    skip_unchanged: bool
+) -> Tuple[str, ...]:
+    """
+    Build the schtasks arguments (see build_schtasks_command), memoized.
+    
+    The result only depends on the arguments, so reinstalling a task with
+    the same settings returns the command built the first time.
+    
+    Returns:
+        Tuple[str, ...]: Command line arguments for schtasks.exe (immutable,
+                         so the cached value can't be changed by a caller).
+    """
+    # Build the command line that the scheduled task will execute
+    # Python interpreter, then our script and its arguments, quoted in one pass
+    run_args = subprocess.list2cmdline([python_exe, *_task_argv(
+        script_path, backup_root, retention_days, threads, large_files, use_vss,
+        incremental, parallel_subtrees, skip_unchanged
+    )])
+
+    # Start building the schtasks command; the fixed options come from
+    # _SCHTASKS_TAIL
+    cmd = [
+        "schtasks",
+        "/Create",         # Create new task
+        "/TN", task_name,  # Task name
+        "/SC", schedule_type,  # Schedule type (DAILY/HOURLY/MINUTE)
+        "/TR", run_args,   # Command to run
+        *_SCHTASKS_TAIL,
+    ]
+
+    # Add start time (used for schedule alignment)
+    # /ST is accepted by all schedule types for initial timing
+    # Callers pass an already validated HH:MM (prompts.prompt_time_hhmm re-prompts
+    # until valid) or None, so this is a plain presence check
+    if start_time_hhmm:
+        cmd.extend(["/ST", start_time_hhmm])
+
+    # Add modifier for HOURLY and MINUTE schedules
+    # /MO specifies the interval (every N hours/minutes)
+    # This parameter is ignored for DAILY schedules
+    if schedule_type in _INTERVAL_SCHEDULES and modifier >= 1:
+        cmd.extend(["/MO", str(modifier)])
+
+    return tuple(cmd)
+
+# Longest /TR value schtasks /Create accepts; longer task commands (deep
+# script or backup paths) are registered from task XML instead
+_SCHTASKS_MAX_TR = 261
+
+# Description shown in Task Scheduler (COM and XML registrations)
+_TASK_DESCRIPTION = "OneDrive versioned backup (headless run)"
+
+# Task XML (Task Scheduler schema 1.2) for the one task shape this script
+# registers; see build_task_xml. No <Settings>: the schema defaults are the
+# same ones schtasks /Create uses
+_TASK_XML_TEMPLATE = """<?xml version="1.0" encoding="UTF-16"?>
+<Task version="1.2" xmlns="http://schemas.microsoft.com/windows/2004/02/mit/task">
+  <RegistrationInfo>
+    <Description>{description}</Description>
+  </RegistrationInfo>
+  <Triggers>
+    {trigger}
+  </Triggers>
+  <Principals>
+    <Principal id="Author">
+      <LogonType>InteractiveToken</LogonType>
+      <RunLevel>HighestAvailable</RunLevel>
+    </Principal>
+  </Principals>
+  <Actions Context="Author">
+    <Exec>
+      <Command>{command}</Command>
+      <Arguments>{arguments}</Arguments>
+    </Exec>
+  </Actions>
+</Task>
+"""
+# Trigger children are in the order Task Scheduler itself exports them
+# (Repetition before StartBoundary, ScheduleByDay after it); schtasks /XML
+# validates the file against the schema, so the order matters
+_TASK_XML_DAILY_TRIGGER = (
+    "<CalendarTrigger><StartBoundary>{start}</StartBoundary>"
+    "<ScheduleByDay><DaysInterval>1</DaysInterval></ScheduleByDay></CalendarTrigger>"
+)
+_TASK_XML_REPEAT_TRIGGER = (
+    "<TimeTrigger><Repetition><Interval>{interval}</Interval></Repetition>"
+    "<StartBoundary>{start}</StartBoundary></TimeTrigger>"
+)
+
+def _task_start_boundary(start_time_hhmm: Optional[str]) -> str:
+    """
+    Return the trigger StartBoundary (local time, no zone) for a start time.
+    
+    schtasks /ST without /SD starts today; no /ST starts now. The COM and
+    XML registrations follow the same rule.
+    """
+    if start_time_hhmm:
+        return f"{dt.date.today().isoformat()}T{start_time_hhmm}:00"
+    return dt.datetime.now().strftime("%Y-%m-%dT%H:%M:00")
+
+def _task_repetition_interval(schedule_type: str, modifier: int) -> str:
+    """
+    Return the ISO 8601 repetition interval for an HOURLY or MINUTE schedule.
+    """
+    unit = "H" if schedule_type == "HOURLY" else "M"
+    return f"PT{modifier}{unit}"
+
+def build_task_xml(
+    schedule_type: str,
+    start_time_hhmm: Optional[str],
+    modifier: int,
+    python_exe: str,
+    arguments: str
+) -> str:
+    """
+    Build the Task Scheduler XML for the scheduled backup task.
+    
+    Describes the same task as build_schtasks_command and _register_task_com,
+    for schtasks /Create /XML. Pure string formatting, no system calls
+    (except reading the clock when start_time_hhmm is None).
+    
+    Args:
+        schedule_type (str): "DAILY", "HOURLY", or "MINUTE".
+        start_time_hhmm (Optional[str]): Start time in HH:MM format (today's
+                                        date), or None for the current time.
+        modifier (int): Interval for HOURLY/MINUTE schedules.
+        python_exe (str): Path to Python interpreter.
+        arguments (str): Arguments from build_task_arguments.
+    
+    Returns:
+        str: The task XML (declared UTF-16, as schtasks expects the file).
+    
+    Note:
+        The task is registered through schtasks (or COM), never by writing
+        into %WINDIR%\\System32\\Tasks: Task Scheduler only runs tasks it
+        registered itself (it also keeps them in the registry).
+    """
+    start = _task_start_boundary(start_time_hhmm)
+    if schedule_type == "DAILY":
+        trigger = _TASK_XML_DAILY_TRIGGER.format(start=start)
+    else:
+        trigger = _TASK_XML_REPEAT_TRIGGER.format(
+            start=start, interval=_task_repetition_interval(schedule_type, modifier)
+        )
+    return _TASK_XML_TEMPLATE.format(
+        description=escape(_TASK_DESCRIPTION),
+        trigger=trigger,
+        command=escape(python_exe),
+        arguments=escape(arguments),
+    )
+
+# Task Scheduler 2.0 API constants (taskschd.h)
+_TASK_TRIGGER_TIME = 1             # One start time (repeated for HOURLY/MINUTE)
+_TASK_TRIGGER_DAILY = 2            # Every N days at the start time
+_TASK_ACTION_EXEC = 0              # Run a program
+_TASK_CREATE_OR_UPDATE = 6         # Same as schtasks /Create /F
+_TASK_LOGON_INTERACTIVE_TOKEN = 3  # Run as the current user (schtasks default)
+_TASK_RUNLEVEL_HIGHEST = 1         # Same as schtasks /RL HIGHEST
+
+# Task Scheduler failures that clear up on their own, typically right after
+# boot or resume while the service is still starting (as unsigned HRESULTs)
+_TRANSIENT_TASK_HRESULTS = frozenset((
+    0x80041315,  # SCHED_E_SERVICE_NOT_RUNNING
+    0x8007041D,  # HRESULT_FROM_WIN32(ERROR_SERVICE_REQUEST_TIMEOUT)
+    0x800706BA,  # HRESULT_FROM_WIN32(RPC_S_SERVER_UNAVAILABLE)
+    0x800706BB,  # HRESULT_FROM_WIN32(RPC_S_SERVER_TOO_BUSY)
+))
+TASK_RETRY_TRIES = 3         # Attempts per Task Scheduler call on transient errors
+TASK_RETRY_BASE_DELAY = 0.5  # Seconds before the first retry, doubled each time (0.5, 1)
+
+def _com_with_backoff(call, max_tries: int = TASK_RETRY_TRIES,
+                      base_delay: float = TASK_RETRY_BASE_DELAY):
+    """
+    Call a Task Scheduler COM method, retrying transient failures.
+    
+    Args:
+        call: Zero-argument callable making the COM call.
+        max_tries (int, optional): Attempts before giving up.
+        base_delay (float, optional): Seconds to wait before the first
+                                      retry; doubled after each one.
+    
+    Returns:
+        Whatever `call` returns.
+    
+    Raises:
+        pywintypes.com_error: Immediately for errors not in
+                              _TRANSIENT_TASK_HRESULTS, else after the
+                              last attempt.
+    
+    Error codes:
+        Late-bound (IDispatch) calls such as RegisterTaskDefinition usually
+        fail with DISP_E_EXCEPTION and carry the real code in
+        excepinfo[5] (scode), so both codes are checked.
+    
+    Note:
+        Only used once pywin32 is known to be installed. schtasks calls are
+        not retried: schtasks exits with 1 for every error, so a transient
+        failure can't be told apart from a bad setting.
+    """
+    import pywintypes
+    
+    for attempt in range(max_tries):
+        try:
+            return call()
+        except pywintypes.com_error as exc:
+            if attempt + 1 == max_tries or not _is_transient_com_error(exc):
+                raise
+        time.sleep(base_delay * (2 ** attempt))
+
+def _is_transient_com_error(exc) -> bool:
+    """
+    Return True if a pywintypes.com_error carries a transient Task Scheduler code.
+    
+    Checks the call's HRESULT and, for DISP_E_EXCEPTION, the scode in
+    excepinfo[5]. pywin32 reports both as signed 32-bit values.
+    """
+    codes = [exc.hresult]
+    if exc.excepinfo and len(exc.excepinfo) > 5 and exc.excepinfo[5]:
+        codes.append(exc.excepinfo[5])
+    return any((code & 0xFFFFFFFF) in _TRANSIENT_TASK_HRESULTS for code in codes)
+
+@functools.lru_cache(maxsize=1)
+def _get_scheduler_service():
+    """
+    Return a connected Task Scheduler service object, created on first use.
+    
+    Dispatching and connecting Schedule.Service costs a COM activation and
+    an RPC round trip to the Task Scheduler service; caching the object lets
+    install_task and stop_task in one interactive session share a single
+    connection. interactive_main releases it (cache_clear) when it is done.
+    
+    Returns:
+        The connected ITaskService object, or None if pywin32 is not
+        installed or Task Scheduler could not be reached (use schtasks).
+    
+    Note:
+        A None result is cached too, so a missing pywin32 or an unreachable
+        service is only found out once per session.
+    """
+    # pywin32 is optional; without it the callers fall back to schtasks
+    try:
+        import pywintypes
+        import win32com.client
+    except ImportError:
+        return None
+    
+    try:
+        scheduler = win32com.client.Dispatch("Schedule.Service")
+        # Connecting fails for a while after boot (service still starting)
+        _com_with_backoff(scheduler.Connect)
+    except pywintypes.com_error:
+        return None
+    return scheduler
+
+def _register_task_com(
+    task_name: str,
+    schedule_type: str,
+    start_time_hhmm: Optional[str],
+    modifier: int,
+    python_exe: str,
+    arguments: str
+) -> Optional[int]:
+    """
+    Register the scheduled task through the Task Scheduler COM API.
+    
+    Builds the same task schtasks /Create would, but in-process: no
+    schtasks.exe launch and no /TR string that has to be quoted for, and
+    re-parsed by, another program. The interpreter is the action's Path and
+    the script arguments its Arguments.
     
-    Example:
-        >>> cmd = build_schtasks_command(
-        ...     "MyBackup", "DAILY", "09:00", 1,
-        ...     "C:/Python/python.exe", Path("backup.py"),
-        ...     Path("D:/Backup"), 30
-        ... )
-        >>> print(" ".join(cmd))
-        schtasks /Create /TN MyBackup /SC DAILY /TR "..." /RL HIGHEST /F /ST 09:00
+    Args:
+        task_name (str): Name for the task in Task Scheduler.
+        schedule_type (str): "DAILY", "HOURLY", or "MINUTE".
+        start_time_hhmm (Optional[str]): Start time in HH:MM format (today's
+                                        date), or None for the current time.
+        modifier (int): Interval for HOURLY/MINUTE schedules.
+        python_exe (str): Path to Python interpreter.
+        arguments (str): Arguments from build_task_arguments.
     
-    Note:
-        - Quotes paths to handle spaces
-        - Uses HIGHEST run level for file access permissions
-        - /F flag overwrites existing tasks automatically
-        - Start time included for all schedule types for consistency
+    Returns:
+        Optional[int]: 0 on success, 1 if Task Scheduler rejected the task,
+                       or None if pywin32 is not installed or Task Scheduler
+                       could not be reached (use schtasks).
+    
+    Triggers:
+        DAILY:  daily trigger, every day at the start time
+        HOURLY: time trigger at the start time, repeated every PT{N}H
+        MINUTE: time trigger at the start time, repeated every PT{N}M
+        (Repetition without a duration repeats indefinitely, like schtasks)
     """
-    # Build the command line that the scheduled task will execute
-    # This runs our script with --headless-run flag and all necessary parameters
-    run_args = (
-        f'"{python_exe}" "{script_path}" '  # Python interpreter and script path
-        f'--headless-run '                   # Flag for non-interactive mode
-        f'--backup-root "{backup_root}" '    # Where to store backups
-        f'--retention-days {retention_days}' # How many days to keep
-    )
-
-    # Start building the schtasks command
-    cmd = [
-        "schtasks",
-        "/Create",         # Create new task
-        "/TN", task_name,  # Task name
-        "/SC", schedule_type,  # Schedule type (DAILY/HOURLY/MINUTE)
-        "/TR", run_args,   # Command to run
-        "/RL", "HIGHEST",  # Run with highest privileges available
-        "/F"               # Force creation (overwrite if exists)
-    ]
-
-    # Add start time if valid (used for schedule alignment)
-    # /ST is accepted by all schedule types for initial timing
-    if validate_time_hhmm(start_time_hhmm):
-        cmd.extend(["/ST", start_time_hhmm])
-
-    # Add modifier for HOURLY and MINUTE schedules
-    # /MO specifies the interval (every N hours/minutes)
-    # This parameter is ignored for DAILY schedules
-    if schedule_type in ("HOURLY", "MINUTE") and modifier >= 1:
-        cmd.extend(["/MO", str(modifier)])
-
-    return cmd
+    # Shared service connection (None: no pywin32, fall back to schtasks)
+    scheduler = _get_scheduler_service()
+    if scheduler is None:
+        return None
+    # Importable here: _get_scheduler_service only succeeds with pywin32
+    import pywintypes
+    
+    try:
+        td = scheduler.NewTask(0)
+        td.RegistrationInfo.Description = _TASK_DESCRIPTION
+        td.Principal.RunLevel = _TASK_RUNLEVEL_HIGHEST
+        
+        # Same start as schtasks (see _task_start_boundary)
+        if schedule_type == "DAILY":
+            trigger = td.Triggers.Create(_TASK_TRIGGER_DAILY)
+            trigger.DaysInterval = 1
+        else:
+            trigger = td.Triggers.Create(_TASK_TRIGGER_TIME)
+            trigger.Repetition.Interval = _task_repetition_interval(schedule_type, modifier)
+        trigger.StartBoundary = _task_start_boundary(start_time_hhmm)
+        
+        action = td.Actions.Create(_TASK_ACTION_EXEC)
+        action.Path = python_exe
+        action.Arguments = arguments
+        
+        folder = scheduler.GetFolder("\\")
+        _com_with_backoff(lambda: folder.RegisterTaskDefinition(
+            task_name, td, _TASK_CREATE_OR_UPDATE, "", "", _TASK_LOGON_INTERACTIVE_TOKEN
+        ))
+    except pywintypes.com_error as exc:
+        # e.g., access denied (not elevated) or an invalid setting
+        print(f"Task Scheduler rejected the task: {exc}", file=sys.stderr)
+        return 1
+    
+    print(f'SUCCESS: The scheduled task "{task_name}" has successfully been created.')
+    return 0
 
 def install_task(
     task_name: str,
     schedule_type: str,
-    start_time_hhmm: str,
+    start_time_hhmm: Optional[str],
     modifier: int,
     backup_root: Path,
-    retention_days: int
+    retention_days: int,
+    threads: int = DEFAULT_THREADS,
+    large_files: bool = False,
+    use_vss: bool = False,
+    incremental: bool = DEFAULT_INCREMENTAL,
+    parallel_subtrees: bool = False,
+    skip_unchanged: bool = False,
+    verbose: bool = False
 ) -> int:
     """
     Register or update a Windows Scheduled Task for automatic backups.
@@ -878,13 +2141,33 @@ def install_task(
     Args:
         task_name (str): Name for the task in Task Scheduler.
         schedule_type (str): Schedule type (DAILY/HOURLY/MINUTE).
-        start_time_hhmm (str): Start time in HH:MM format.
+        start_time_hhmm (Optional[str]): Start time in HH:MM format, or None
+                                        to start from the current time.
         modifier (int): Interval for HOURLY/MINUTE schedules.
         backup_root (Path): Backup destination directory.
         retention_days (int): Days of backups to keep.
+        threads (int, optional): Robocopy copy threads for scheduled runs.
+        large_files (bool, optional): Use robocopy /J for scheduled runs.
+        use_vss (bool, optional): Copy from a VSS shadow copy in scheduled runs.
+        incremental (bool, optional): Hard-link unchanged files in scheduled runs.
+        parallel_subtrees (bool, optional): One robocopy per top-level folder
+                                           in scheduled runs.
+        skip_unchanged (bool, optional): Skip the copy in scheduled runs when
+                                        the change journal hasn't moved.
+        verbose (bool, optional): Echo the registered command line even when
+                                 stdout is not a console (it always is on
+                                 a console).
     
     Returns:
-        int: Exit code from schtasks (0 = success).
+        int: 0 on success; otherwise the schtasks exit code, or 1 if the
+             Task Scheduler API rejected the task.
+    
+    Registration:
+        - With pywin32 installed, through the Task Scheduler COM API
+          (see _register_task_com): in-process, no schtasks.exe launch
+        - Otherwise with schtasks /Create (see build_schtasks_command), or
+          schtasks /Create /XML (see build_task_xml) when the task command
+          is longer than /TR allows
     
     Task Properties:
         - Runs with highest available privileges
@@ -902,8 +2185,8 @@ def install_task(
         ...     "DailyBackup", "DAILY", "09:00", 1,
         ...     Path("D:/Backup"), 30
         ... )
-        Registering Scheduled Task with command:
-        schtasks /Create /TN DailyBackup ...
+        Registering Scheduled Task to run:
+        C:\\Python\\python.exe C:\\Tools\\main.py --headless-run ...
         SUCCESS: The scheduled task "DailyBackup" has successfully been created.
         >>> print(result)
         0
@@ -919,36 +2202,251 @@ def install_task(
         - Task will start at next scheduled time
         - Check Event Viewer for task execution history
     """
-    # Get the Python executable path that's running this script
-    python_exe = sys.executable
+    # The Python executable running this script (taken once at import)
+    python_exe = _PYTHON_EXE
     
     # Get the absolute path to this script file
-    script_path = Path(__file__).resolve()
-    
-    # Build the complete schtasks command
-    cmd = build_schtasks_command(
+    # Reuses the resolution cached in the backup root by a previous install
+    script_path = _installed_script_path(backup_root)
+    
+    # The command line echo is for someone watching; redirected (scripted
+    # --config) runs skip it unless --verbose. Results are always shown
+    echo = verbose or sys.stdout.isatty()
+    
+    # Preferred: register through the Task Scheduler API when pywin32 is
+    # available (the connection is made, or found missing, before anything
+    # is printed, so exactly one banner is shown either way)
+    if _get_scheduler_service() is not None:
+        arguments = build_task_arguments(
+            script_path, backup_root, retention_days, threads, large_files, use_vss,
+            incremental, parallel_subtrees, skip_unchanged
+        )
+        # One write for the banner and the command line
+        if echo:
+            sys.stdout.write(f"\nRegistering Scheduled Task to run:\n"
+                             f"{subprocess.list2cmdline([python_exe])} {arguments}\n")
+        rc = _register_task_com(task_name, schedule_type, start_time_hhmm, modifier,
+                                python_exe, arguments)
+        if rc is not None:
+            return rc
+    
+    # Fallback: build the complete schtasks command (/TR, or /XML when the
+    # task command is too long for /TR)
+    cmd, xml_path = _schtasks_create_command(
         task_name, schedule_type, start_time_hhmm, modifier,
-        python_exe, script_path, backup_root, retention_days
+        python_exe, script_path, backup_root, retention_days, threads, large_files, use_vss,
+        incremental, parallel_subtrees, skip_unchanged
     )
 
-    # Show the user what command we're running for transparency
-    print("\nRegistering Scheduled Task with command:")
-    print(" ".join(cmd))
+    # Show the user the final command (/TR or /XML) for transparency, in one
+    # write; list2cmdline shows the command line exactly as subprocess passes it
+    if echo:
+        sys.stdout.write(f"\nRegistering Scheduled Task with command:\n"
+                         f"{subprocess.list2cmdline(cmd)}\n")
     
     # Execute the schtasks command
-    res = subprocess.run(cmd, capture_output=True, text=True)
+    # Its output is a line or two, so it goes straight to temporary files
+    # (no pipes to drain) and is only read back to show the result
+    try:
+        with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+            res = subprocess.run(cmd, stdout=out, stderr=err)
+            out.seek(0)
+            err.seek(0)
+            _show_schtasks_result(res.returncode, out.read(), err.read())
+    finally:
+        # The XML is only needed while schtasks reads it
+        if xml_path is not None:
+            os.remove(xml_path)
     
-    # Display results
-    if res.returncode != 0:
+    return res.returncode
+
+def _schtasks_create_command(
+    task_name: str,
+    schedule_type: str,
+    start_time_hhmm: Optional[str],
+    modifier: int,
+    python_exe: str,
+    script_path: Path,
+    backup_root: Path,
+    retention_days: int,
+    threads: int,
+    large_files: bool,
+    use_vss: bool,
+    incremental: bool,
+    parallel_subtrees: bool,
+    skip_unchanged: bool
+) -> Tuple[List[str], Optional[str]]:
+    """
+    Choose the schtasks /Create command for install_task and install_task_async.
+    
+    Normally build_schtasks_command's /TR command. schtasks rejects a /TR
+    longer than _SCHTASKS_MAX_TR characters (deep script or backup paths),
+    so the same task is then written as XML (build_task_xml) to a temporary
+    file and registered with /XML, which has no such limit.
+    
+    Returns:
+        Tuple[List[str], Optional[str]]: The schtasks command, and the path
+                                         of the temporary XML file (None for
+                                         /TR). The caller deletes the file
+                                         once schtasks has finished.
+    """
+    cmd = build_schtasks_command(
+        task_name, schedule_type, start_time_hhmm, modifier,
+        python_exe, script_path, backup_root, retention_days, threads, large_files, use_vss,
+        incremental, parallel_subtrees, skip_unchanged
+    )
+    if len(cmd[cmd.index("/TR") + 1]) <= _SCHTASKS_MAX_TR:
+        return cmd, None
+    
+    arguments = build_task_arguments(
+        script_path, backup_root, retention_days, threads, large_files, use_vss,
+        incremental, parallel_subtrees, skip_unchanged
+    )
+    fd, xml_path = tempfile.mkstemp(suffix=".xml")
+    with open(fd, "w", encoding="utf-16") as fh:
+        fh.write(build_task_xml(schedule_type, start_time_hhmm, modifier, python_exe, arguments))
+    return ["schtasks", "/Create", "/TN", task_name, "/XML", xml_path, "/F"], xml_path
+
+def _show_schtasks_result(returncode: int, out: bytes, err: bytes) -> None:
+    """
+    Show schtasks' own message: its stderr on failure, its stdout otherwise.
+    
+    The bytes are written as-is, since schtasks writes in the console code
+    page.
+    """
+    if returncode != 0:
         # Task creation failed - show error message
-        print(res.stderr, file=sys.stderr)
+        sys.stderr.flush()
+        sys.stderr.buffer.write(err)
+        sys.stderr.buffer.flush()
     else:
         # Task created successfully - show success message
-        print(res.stdout)
+        sys.stdout.flush()
+        sys.stdout.buffer.write(out)
+        sys.stdout.buffer.flush()
+
+def install_task_async(
+    task_name: str,
+    schedule_type: str,
+    start_time_hhmm: Optional[str],
+    modifier: int,
+    backup_root: Path,
+    retention_days: int,
+    threads: int = DEFAULT_THREADS,
+    large_files: bool = False,
+    use_vss: bool = False,
+    incremental: bool = DEFAULT_INCREMENTAL,
+    parallel_subtrees: bool = False,
+    skip_unchanged: bool = False,
+    verbose: bool = False
+) -> Tuple[subprocess.Popen, Optional[str]]:
+    """
+    Start registering the scheduled task with schtasks, without waiting.
     
-    return res.returncode
+    Used by interactive mode with --parallel-setup: schtasks registers the
+    task while the one-time backup runs, and wait_install_task collects the
+    result afterward. Same arguments and task as install_task.
+    
+    Returns:
+        Tuple[subprocess.Popen, Optional[str]]: The running schtasks /Create
+                                                process and its temporary
+                                                task XML file, if any (see
+                                                _schtasks_create_command);
+                                                pass both to wait_install_task.
+    
+    Note:
+        - Always uses schtasks, even with pywin32 installed: the COM
+          registration runs in-process, so there is no launch to overlap
+        - Its output is a line or two, far below the pipe buffer size, so
+          the pipes can be left unread until wait_install_task
+    """
+    # Same command choice (/TR or /XML) as install_task
+    cmd, xml_path = _schtasks_create_command(
+        task_name, schedule_type, start_time_hhmm, modifier,
+        _PYTHON_EXE, _installed_script_path(backup_root), backup_root, retention_days, threads, large_files,
+        use_vss, incremental, parallel_subtrees, skip_unchanged
+    )
+    
+    # Same echo rule as install_task
+    if verbose or sys.stdout.isatty():
+        sys.stdout.write(f"\nRegistering Scheduled Task with command:\n"
+                         f"{subprocess.list2cmdline(cmd)}\n")
+    try:
+        return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE), xml_path
+    except OSError:
+        # schtasks couldn't be started; don't leave the XML behind
+        if xml_path is not None:
+            os.remove(xml_path)
+        raise
+
+def wait_install_task(pending: Tuple[subprocess.Popen, Optional[str]]) -> int:
+    """
+    Wait for install_task_async's schtasks and show its result.
+    
+    Args:
+        pending (Tuple[subprocess.Popen, Optional[str]]): What
+            install_task_async returned; the task XML file, if any, is
+            deleted once schtasks has finished.
+    
+    Returns:
+        int: The schtasks exit code (0 on success).
+    """
+    proc, xml_path = pending
+    try:
+        out, err = proc.communicate()
+    finally:
+        if xml_path is not None:
+            os.remove(xml_path)
+    _show_schtasks_result(proc.returncode, out, err)
+    return proc.returncode
+
+def _stop_task_com(task_name: str) -> bool:
+    """
+    Disable (or else delete) a scheduled task through the Task Scheduler API.
+    
+    One in-process COM round trip instead of one or two schtasks.exe
+    launches; a missing task is found out by GetTask, not by a failed
+    process.
+    
+    Args:
+        task_name (str): Name of the task to stop.
+    
+    Returns:
+        bool: True if the API was used (the outcome has been printed),
+              False if pywin32 is not installed or Task Scheduler could not
+              be reached (use schtasks).
+    """
+    # Shared service connection (None: no pywin32, fall back to schtasks)
+    scheduler = _get_scheduler_service()
+    if scheduler is None:
+        return False
+    # Importable here: _get_scheduler_service only succeeds with pywin32
+    import pywintypes
+    
+    try:
+        folder = scheduler.GetFolder("\\")
+    except pywintypes.com_error:
+        return False
+    
+    # First attempt: disable the task (keeps its definition)
+    # Both calls retry transient errors, same as registration
+    try:
+        _com_with_backoff(lambda: setattr(folder.GetTask(task_name), "Enabled", False))
+        print(f"Task '{task_name}' disabled.")
+        return True
+    except pywintypes.com_error:
+        pass
+    
+    # Second attempt: delete the task entirely
+    try:
+        _com_with_backoff(lambda: folder.DeleteTask(task_name, 0))
+        print(f"Task '{task_name}' deleted.")
+    except pywintypes.com_error:
+        # Task doesn't exist or we lack permissions
+        print("No task found to stop or delete.", file=sys.stderr)
+    return True
 
-def stop_task(task_name: str) -> None:
+def stop_task(task_name: str, verbose: bool = False) -> None:
     """
     Stop and optionally delete a scheduled task.
     
@@ -957,11 +2455,15 @@ def stop_task(task_name: str) -> None:
     
     Args:
         task_name (str): Name of the task to stop.
+        verbose (bool, optional): Print the "Stopping task" progress line even
+                                 when stdout is not a console.
     
     Process:
         1. Try to disable the task (keeps configuration)
         2. If disable fails, try to delete the task
         3. Report the outcome to user
+        (Through the Task Scheduler API if pywin32 is installed, see
+        _stop_task_com; with schtasks otherwise)
     
     Disable vs Delete:
         - Disable: Task remains in Task Scheduler but won't run
@@ -981,12 +2483,19 @@ def stop_task(task_name: str) -> None:
         - Gracefully handles non-existent tasks
         - Uses /F flag to force deletion without confirmation
     """
-    print(f"\nStopping task '{task_name}'...")
+    # Progress line only for someone watching; the outcome is always printed
+    if verbose or sys.stdout.isatty():
+        print(f"\nStopping task '{task_name}'...")
+    
+    # Preferred: one in-process API call when pywin32 is available
+    if _stop_task_com(task_name):
+        return
     
     # First attempt: Try to disable the task
     # This keeps the task definition but prevents it from running
+    # Only the exit codes are used, so the output is discarded, not captured
     disable = subprocess.run(["schtasks", "/Change", "/TN", task_name, "/Disable"],
-                             capture_output=True, text=True)
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     if disable.returncode == 0:
         print(f"Task '{task_name}' disabled.")
         return
@@ -994,7 +2503,7 @@ def stop_task(task_name: str) -> None:
     # Second attempt: Try to delete the task entirely
     # Use /F to force deletion without confirmation prompt
     delete = subprocess.run(["schtasks", "/Delete", "/TN", task_name, "/F"],
-                            capture_output=True, text=True)
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     if delete.returncode == 0:
         print(f"Task '{task_name}' deleted.")
     else:
@@ -1002,11 +2511,171 @@ def stop_task(task_name: str) -> None:
         print("No task found to stop or delete.", file=sys.stderr)
 
 
+# =============================
+# CONFIGURATION FILE (--config)
+# =============================
+
+# Settings accepted in a --config JSON file, with the value used when omitted
+CONFIG_DEFAULTS = {
+    "retention_days": DEFAULT_RETENTION_DAYS,
+    "backup_root": DEFAULT_BACKUP_ROOT,
+    "task_name": DEFAULT_TASK_NAME,
+    "schedule_type": DEFAULT_SCHEDULE_TYPE,
+    "start_time": DEFAULT_START_TIME,
+    "modifier": DEFAULT_MODIFIER,
+    "threads": DEFAULT_THREADS,
+    "large_files": False,
+    "use_vss": False,
+    "incremental": DEFAULT_INCREMENTAL,
+    "parallel_subtrees": False,
+    "skip_unchanged": False,
+    "run_now": True,          # Same as answering "Run a one-time backup now?" with yes
+    "install_task": True,     # Same as answering "Install or update the Scheduled Task?" with yes
+}
+
+def load_config(path: str) -> dict:
+    """
+    Load and validate wizard settings from a JSON file.
+    
+    A config file answers every interactive prompt in one read, so the same
+    setup can be reproduced (or scripted) without typing through the wizard.
+    
+    Args:
+        path (str): Path to a JSON file containing an object whose keys are a
+                    subset of CONFIG_DEFAULTS.
+    
+    Returns:
+        dict: All CONFIG_DEFAULTS keys, with values from the file where given.
+    
+    Raises:
+        ValueError: If the file can't be read, isn't a JSON object, or is
+                    rejected by validate_config (unknown keys, invalid values).
+    
+    Example:
+        backup_settings.json:
+            {"retention_days": 14, "backup_root": "E:/Backups",
+             "schedule_type": "HOURLY", "modifier": 4, "run_now": false}
+        
+        >>> cfg = load_config("backup_settings.json")
+        >>> cfg["modifier"], cfg["task_name"]
+        (4, 'OneDriveVersionedBackup')
+    """
+    try:
+        with open(path, encoding="utf-8") as fh:
+            data = json.load(fh)
+    except (OSError, json.JSONDecodeError) as exc:
+        raise ValueError(f"cannot read {path}: {exc}") from exc
+    
+    if not isinstance(data, dict):
+        raise ValueError("expected a JSON object")
+    
+    return validate_config(data)
+
+def validate_config(data: dict) -> dict:
+    """
+    Check wizard settings the same way the prompts would, and fill defaults.
+    
+    Shared by load_config (--config) and defaults_config (--yes), so an
+    unattended setup can never get past a value the wizard would refuse.
+    
+    Args:
+        data (dict): Settings whose keys are a subset of CONFIG_DEFAULTS.
+    
+    Returns:
+        dict: All CONFIG_DEFAULTS keys, with values from `data` where given
+              (schedule_type uppercased, modifier 1 for DAILY).
+    
+    Raises:
+        ValueError: If `data` contains unknown keys or has invalid values;
+                    the message names the setting and what was expected.
+    """
+    # Reject typos instead of silently ignoring them
+    unknown = sorted(set(data) - set(CONFIG_DEFAULTS))
+    if unknown:
+        raise ValueError(f"unknown setting(s): {', '.join(unknown)}")
+    
+    cfg = {**CONFIG_DEFAULTS, **data}
+    
+    # Validate each value the same way the prompts would
+    # Every error names the setting, what was expected and what was found
+    def invalid(key: str, expected: str) -> ValueError:
+        return ValueError(f"{key}: expected {expected}, got {json.dumps(cfg[key])}")
+    
+    # Integers with their allowed range (threads: robocopy's /MT limit, the
+    # same range as the prompt and --threads)
+    for key, high in (("retention_days", None), ("modifier", None), ("threads", MAX_THREADS)):
+        value = cfg[key]
+        if not isinstance(value, int) or isinstance(value, bool) or value < 1 \
+                or (high is not None and value > high):
+            raise invalid(key, "an integer >= 1" if high is None else f"an integer from 1 to {high}")
+    for key in ("backup_root", "task_name", "schedule_type"):
+        if not isinstance(cfg[key], str) or not cfg[key].strip():
+            raise invalid(key, "a non-empty string")
+    for key in ("large_files", "use_vss", "incremental", "parallel_subtrees", "skip_unchanged",
+                "run_now", "install_task"):
+        if not isinstance(cfg[key], bool):
+            raise invalid(key, "true or false")
+    
+    if cfg["schedule_type"].upper() not in _prompts().SCHEDULE_TYPES:
+        raise invalid("schedule_type", '"DAILY", "HOURLY" or "MINUTE"')
+    cfg["schedule_type"] = cfg["schedule_type"].upper()
+    # MINUTE may leave start_time null (no /ST, same as prompts.prompt_schedule)
+    if cfg["start_time"] is None and cfg["schedule_type"] == "MINUTE":
+        pass
+    elif not isinstance(cfg["start_time"], str) or not _prompts().validate_time_hhmm(cfg["start_time"]):
+        raise invalid("start_time", "a 24-hour \"HH:MM\" string (or null for MINUTE)")
+    
+    # DAILY ignores the modifier, same as prompts.prompt_schedule
+    if cfg["schedule_type"] == "DAILY":
+        cfg["modifier"] = 1
+    
+    return cfg
+
+def defaults_config(parsed: dict) -> dict:
+    """
+    Build wizard settings for --yes: every default, plus the command line.
+    
+    Lets a scripted setup accept all defaults without a config file. The
+    result has the same keys as load_config's, so interactive_main runs it
+    the same way (no prompts; back up now, then install the task).
+    
+    Args:
+        parsed (dict): Result of parse_args.
+    
+    Returns:
+        dict: CONFIG_DEFAULTS with backup_root, retention_days, threads and
+              the copy flags taken from the command line.
+    
+    Raises:
+        ValueError: If a command-line value fails validate_config (e.g.,
+                    --retention-days 0, which would prune every run).
+    
+    Example:
+        python main.py --yes --backup-root "E:\\Backups" --retention-days 14
+    """
+    # Same checks as a --config file: --yes installs a recurring task
+    # without asking, so a bad value must stop it up front
+    return validate_config({
+        "backup_root": parsed["backup_root"],
+        "retention_days": parsed["retention_days"],
+        "threads": parsed["threads"],
+        "large_files": parsed["large_files"],
+        "use_vss": parsed["use_vss"],
+        "incremental": parsed["incremental"],
+        "parallel_subtrees": parsed["parallel_subtrees"],
+        "skip_unchanged": parsed["skip_unchanged"],
+    })
+
+
 # =============================
 # MAIN INTERACTIVE FLOW
 # =============================
 
-def interactive_main() -> int:
+def interactive_main(
+    verbose: bool = False,
+    config: Optional[dict] = None,
+    parallel_setup: bool = False
+) -> int:
     """
     Main interactive entry point for the script.
     
@@ -1016,8 +2685,22 @@ def interactive_main() -> int:
     3. Optionally creates/updates a scheduled task
     4. Optionally stops an existing task
     
+    Args:
+        verbose (bool, optional): Show robocopy's stderr during the one-time
+                                 backup (from --verbose). Defaults to False.
+        config (dict, optional): Settings from load_config() (--config). When
+                                given, every prompt is skipped and its answer
+                                taken from the config instead.
+        parallel_setup (bool, optional): Register the scheduled task with
+                                        schtasks while the one-time backup
+                                        runs (from --parallel-setup). Both
+                                        questions are then asked before the
+                                        backup starts. Defaults to False.
+    
     Returns:
-        int: Exit code (always 0 for interactive mode).
+        int: Exit code: 0, or 1 when the prompts were skipped (config given)
+             and the one-time backup or the task registration failed, so
+             scripted setups can detect it.
     
     User Experience Flow:
         1. Welcome message
@@ -1025,6 +2708,9 @@ def interactive_main() -> int:
            - Retention days (how long to keep backups)
            - Backup destination folder
            - Task name for scheduler
+           - Robocopy thread count, unbuffered I/O and parallel folder copies
+           - Whether to copy from a VSS shadow copy
+           - Whether to hard-link unchanged files (incremental backups)
            - Schedule type and timing
         3. Action prompts:
            - Run backup now? (recommended for testing)
@@ -1044,6 +2730,11 @@ def interactive_main() -> int:
         Retention in days (how many days of dated backups to keep) [30]: 7
         Backup root folder (should NOT be inside OneDrive) [D:\\OneDriveBackup]: E:\\Backups
         Scheduled Task name [OneDriveVersionedBackup]: <Enter>
+        Robocopy threads (/MT) [16]: <Enter>
+        Mostly large files (video/ISO/archives)? Use unbuffered I/O (/J) [y/N]: <Enter>
+        Copy each top-level OneDrive folder with its own robocopy (deep trees, SSD) [y/N]: <Enter>
+        Copy from a VSS shadow copy so files in use don't fail (needs Administrator) [y/N]: <Enter>
+        Hard-link unchanged files to the previous backup (saves space; NTFS only) [Y/n]: <Enter>
         
         Schedule type options supported here:
           DAILY  - run once each day at the time you choose
@@ -1071,7 +2762,7 @@ def interactive_main() -> int:
     Note:
         - Designed for Windows users of all skill levels
         - No command-line arguments needed
-        - Settings are not persisted (asked each time)
+        - Settings are not persisted (asked each time, or read from --config)
         - Consider running as administrator for best results
     """
     # Display welcome banner
@@ -1079,15 +2770,110 @@ def interactive_main() -> int:
 
     # STEP 1: Collect configuration settings
     
+    # Scripted run: take every answer from the config file, ask nothing
+    if config is not None:
+        print("Using settings from --config/--yes (prompts skipped).")
+        retention_days = config["retention_days"]
+        backup_root = Path(config["backup_root"]).expanduser()
+        task_name = config["task_name"]
+        threads = config["threads"]
+        large_files = config["large_files"]
+        parallel_subtrees = config["parallel_subtrees"]
+        use_vss = config["use_vss"]
+        incremental = config["incremental"]
+        skip_unchanged = config["skip_unchanged"]
+        schedule_type = config["schedule_type"]
+        start_time = config["start_time"]
+        modifier = config["modifier"]
+    else:
+        retention_days, backup_root, task_name, threads, large_files, parallel_subtrees, use_vss, \
+            incremental, skip_unchanged, schedule_type, start_time, modifier = _prompt_settings()
+
+    # Set when the backup or the task registration fails (exit code 1 when
+    # scripted, see Returns)
+    failed = False
+
+    # STEP 2: Optional immediate backup
+    # Useful for testing configuration and permissions
+    run_now = config["run_now"] if config is not None else \
+        _prompts().prompt_yes_no_default("Run a one-time backup now?", default_yes=True)
+    
+    # With --parallel-setup, decide on the task first and let schtasks
+    # register it in the background while the backup runs (STEP 3 waits)
+    install = None
+    pending_install = None
+    if parallel_setup:
+        install = config["install_task"] if config is not None else \
+            _prompts().prompt_yes_no_default("Install or update the Scheduled Task with these settings?", default_yes=True)
+        if install and run_now:
+            pending_install = install_task_async(
+                task_name, schedule_type, start_time, modifier, backup_root, retention_days,
+                threads, large_files, use_vss, incremental, parallel_subtrees, skip_unchanged,
+                verbose
+            )
+    
+    if run_now:
+        rc = run_once(backup_root, retention_days, threads, verbose=verbose,
+                      large_files=large_files, use_vss=use_vss, incremental=incremental,
+                      parallel_subtrees=parallel_subtrees, skip_unchanged=skip_unchanged)
+        if rc >= 8:
+            # Backup failed with serious error
+            # Inform user but continue (they may want to schedule anyway)
+            failed = True
+            print("Backup failed (robocopy exit code >= 8). Fix issues and try again.", file=sys.stderr)
+
+    # STEP 3: Optional task scheduling
+    # Creates or updates the Windows Scheduled Task
+    if install is None:
+        install = config["install_task"] if config is not None else \
+            _prompts().prompt_yes_no_default("Install or update the Scheduled Task with these settings?", default_yes=True)
+    if install:
+        if pending_install is not None:
+            rc = wait_install_task(pending_install)
+        else:
+            rc = install_task(task_name, schedule_type, start_time, modifier, backup_root, retention_days,
+                              threads, large_files, use_vss, incremental, parallel_subtrees,
+                              skip_unchanged, verbose)
+        if rc != 0:
+            # Task registration failed
+            # Common cause: need administrator privileges
+            failed = True
+            print("Task registration failed. You may need to run your shell as Administrator.", file=sys.stderr)
+
+    # STEP 4: Optional task stopping
+    # Allows user to disable/delete task if needed (never asked with --config or --yes)
+    if config is None and _prompts().prompt_yes_no_default("Do you want to stop (disable/delete) the Scheduled Task now?",
+                                                           default_yes=False):
+        stop_task(task_name, verbose)
+
+    # Release the Task Scheduler connection shared by install and stop
+    _get_scheduler_service.cache_clear()
+    
+    # Display completion message
+    print("\nDone.")
+    return 1 if failed and config is not None else 0
+
+def _prompt_settings() -> Tuple[int, Path, str, int, bool, bool, bool, bool, bool, str, Optional[str], int]:
+    """
+    Ask the wizard's configuration questions (STEP 1 of interactive_main).
+    
+    Returns:
+        Tuple: (retention_days, backup_root, task_name, threads, large_files,
+                parallel_subtrees, use_vss, incremental, skip_unchanged,
+                schedule_type, start_time, modifier)
+    """
+    # The wizard's input helpers (imported now that they are needed)
+    p = _prompts()
+    
     # Ask for retention period with explanation
-    retention_days = prompt_int_with_default(
+    retention_days = p.prompt_int_with_default(
         "Retention in days (how many days of dated backups to keep)",
         DEFAULT_RETENTION_DAYS,
         min_value=1
     )
 
     # Ask for backup destination with warning about OneDrive
-    backup_root_str = prompt_with_default(
+    backup_root_str = p.prompt_with_default(
         "Backup root folder (should NOT be inside OneDrive)",
         DEFAULT_BACKUP_ROOT
     )
@@ -1095,47 +2881,158 @@ def interactive_main() -> int:
     backup_root = Path(backup_root_str).expanduser()
 
     # Ask for task name (shown in Task Scheduler)
-    task_name = prompt_with_default(
+    task_name = p.prompt_with_default(
         "Scheduled Task name",
         DEFAULT_TASK_NAME
     )
 
-    # Ask for schedule configuration
-    schedule_type, start_time, modifier = prompt_schedule()
+    # Ask for robocopy parallelism (SSD targets handle more threads than HDDs)
+    threads = p.prompt_int_with_default(
+        "Robocopy threads (/MT)",
+        DEFAULT_THREADS,
+        min_value=1,
+        max_value=MAX_THREADS
+    )
 
-    # STEP 2: Optional immediate backup
-    # Useful for testing configuration and permissions
-    if prompt_yes_no_default("Run a one-time backup now?", default_yes=True):
-        rc = run_once(backup_root, retention_days)
-        if rc >= 8:
-            # Backup failed with serious error
-            # Inform user but continue (they may want to schedule anyway)
-            print("Backup failed (robocopy exit code >= 8). Fix issues and try again.", file=sys.stderr)
+    # Ask whether to use unbuffered I/O (only worth it for very large files)
+    large_files = p.prompt_yes_no_default(
+        "Mostly large files (video/ISO/archives)? Use unbuffered I/O (/J)",
+        default_yes=False
+    )
 
-    # STEP 3: Optional task scheduling
-    # Creates or updates the Windows Scheduled Task
-    if prompt_yes_no_default("Install or update the Scheduled Task with these settings?", default_yes=True):
-        rc = install_task(task_name, schedule_type, start_time, modifier, backup_root, retention_days)
-        if rc != 0:
-            # Task registration failed
-            # Common cause: need administrator privileges
-            print("Task registration failed. You may need to run your shell as Administrator.", file=sys.stderr)
+    # Ask whether to walk top-level folders in parallel (helps deep trees on SSDs)
+    parallel_subtrees = p.prompt_yes_no_default(
+        "Copy each top-level OneDrive folder with its own robocopy (deep trees, SSD)",
+        default_yes=False
+    )
 
-    # STEP 4: Optional task stopping
-    # Allows user to disable/delete task if needed
-    if prompt_yes_no_default("Do you want to stop (disable/delete) the Scheduled Task now?", default_yes=False):
-        stop_task(task_name)
+    # Ask whether to copy from a shadow copy (avoids retries on files in use)
+    use_vss = p.prompt_yes_no_default(
+        "Copy from a VSS shadow copy so files in use don't fail (needs Administrator)",
+        default_yes=False
+    )
 
-    # Display completion message
-    print("\nDone.")
-    return 0
+    # Ask whether to hard-link unchanged files (needs an NTFS backup drive)
+    incremental = p.prompt_yes_no_default(
+        "Hard-link unchanged files to the previous backup (saves space; NTFS only)",
+        default_yes=DEFAULT_INCREMENTAL
+    )
+
+    # Ask whether to trust the change journal (volume-wide, so only worth it
+    # when OneDrive has a drive to itself)
+    skip_unchanged = p.prompt_yes_no_default(
+        "Skip the copy when the OneDrive drive's change journal shows no changes (OneDrive on its own drive only)",
+        default_yes=False
+    )
+
+    # Ask for schedule configuration
+    schedule_type, start_time, modifier = p.prompt_schedule(
+        DEFAULT_SCHEDULE_TYPE, DEFAULT_START_TIME, DEFAULT_MODIFIER
+    )
+
+    return (retention_days, backup_root, task_name, threads, large_files,
+            parallel_subtrees, use_vss, incremental, skip_unchanged, schedule_type, start_time,
+            modifier)
 
 
 # =============================
 # HEADLESS ENTRY FOR SCHEDULED TASK
 # =============================
 
-def headless_run(backup_root: Path, retention_days: int) -> int:
+def _exec_robocopy(
+    backup_root: str,
+    retention_days: int,
+    threads: int,
+    verbose: bool,
+    large_files: bool,
+    incremental: bool
+) -> None:
+    """
+    Replace this Python process with the backup's robocopy (--exec-replace).
+    
+    A plain headless run keeps the interpreter resident for the whole copy
+    only to collect robocopy's exit code and then prune. When there is
+    nothing to prune, that wait is the only work left, so the process is
+    handed to robocopy with os.execvp instead.
+    
+    Args:
+        backup_root (str): Directory where backups are stored.
+        retention_days (int): Number of days of backups to keep.
+        threads (int): Robocopy copy threads (/MT:N).
+        verbose (bool): Also show robocopy's stderr output.
+        large_files (bool): Use robocopy unbuffered I/O (/J).
+        incremental (bool): Hard-link files unchanged since the previous
+                            backup before handing over.
+    
+    Returns:
+        None: Only returns when the run is not eligible (source or backup
+              root missing, robocopy not on PATH, something to prune, or low
+              disk space) or the exec itself failed; the caller then does a
+              normal run_once.
+    
+    Note:
+        - Skipped after exec: the .last_backup_size and .last_usn updates
+          and the exit code check. A stale .last_usn only makes the next
+          run copy when it could have skipped; it never causes a skip
+        - On Windows the C runtime emulates exec by starting robocopy and
+          ending this process, so Task Scheduler sees the task finish (with
+          result 0) as soon as robocopy starts. Only use --exec-replace where
+          robocopy's exit code is not monitored
+    """
+    # Eligibility: anything run_once would do besides copying means no exec
+    src = onedrive_path()
+    if not os.path.isdir(src) or not os.path.isdir(backup_root):
+        return
+    # Checked before the dated folder is seeded, so a missing robocopy never
+    # leaves a half-linked folder behind (run_once reports the error)
+    if shutil.which("robocopy") is None:
+        return
+    root = Path(backup_root)
+    if _expired_backups(root, retention_days) or not has_space_for_backup(root):
+        return
+    
+    # Same destination, hard links and robocopy command as run_once
+    # (an existing folder is reported by run_once, see there)
+    dst = root / timestamp_stamp()
+    if os.path.lexists(dst):
+        return
+    prev = find_previous_snapshot(root, dst.name) if incremental else None
+    if prev is not None:
+        linked, _ = hardlink_unchanged(src, prev, dst)
+        print(f"\nHard-linked {linked} unchanged file(s) from {prev}")
+    dst.mkdir(parents=True, exist_ok=True)
+    cmd = _robocopy_command(src, dst, threads, verbose, large_files, keep_existing=prev is not None)
+    print("\nRunning:", " ".join(cmd))
+    
+    # Buffered output would be lost with the process image
+    sys.stdout.flush()
+    sys.stderr.flush()
+    
+    # The Windows C runtime joins exec arguments with spaces unquoted, so
+    # paths with spaces (e.g., "OneDrive - Contoso") are quoted here
+    if os.name == "nt":
+        cmd = [subprocess.list2cmdline([arg]) for arg in cmd]
+    try:
+        os.execvp("robocopy", cmd)
+    except OSError as exc:
+        # The exec failed, so robocopy never ran: remove the half-seeded
+        # folder (the next run would otherwise link from it as the previous
+        # snapshot) and let the caller do a normal run_once
+        print(f"Could not start robocopy ({exc}); running normally.", file=sys.stderr)
+        shutil.rmtree(dst, ignore_errors=True)
+
+def headless_run(
+    backup_root: str,
+    retention_days: int,
+    threads: int = DEFAULT_THREADS,
+    verbose: bool = False,
+    large_files: bool = False,
+    use_vss: bool = False,
+    incremental: bool = DEFAULT_INCREMENTAL,
+    parallel_subtrees: bool = False,
+    skip_unchanged: bool = False,
+    exec_replace: bool = False
+) -> int:
     """
     Execute backup in headless (non-interactive) mode.
     
@@ -1144,8 +3041,22 @@ def headless_run(backup_root: Path, retention_days: int) -> int:
     without any user interaction.
     
     Args:
-        backup_root (Path): Directory where backups are stored.
+        backup_root (str): Directory where backups are stored, as given on
+                           the command line.
         retention_days (int): Number of days of backups to keep.
+        threads (int, optional): Robocopy copy threads (/MT:N).
+        verbose (bool, optional): Also show robocopy's stderr output.
+        large_files (bool, optional): Use robocopy unbuffered I/O (/J).
+        use_vss (bool, optional): Copy from a VSS shadow copy.
+        incremental (bool, optional): Hard-link files unchanged since the
+                                     previous backup.
+        parallel_subtrees (bool, optional): One robocopy per top-level folder.
+        skip_unchanged (bool, optional): Skip the copy when the change journal
+                                        hasn't moved (see run_once).
+        exec_replace (bool, optional): Hand the process over to robocopy when
+                                      there is nothing to prune (see
+                                      _exec_robocopy). Ignored with use_vss,
+                                      parallel_subtrees or skip_unchanged.
     
     Returns:
         int: Exit code (0 = success, >0 = error).
@@ -1162,7 +3073,7 @@ def headless_run(backup_root: Path, retention_days: int) -> int:
         - Testing with specific parameters
     
     Example:
-        >>> result = headless_run(Path("D:/Backup"), 7)
+        >>> result = headless_run("D:/Backup", 7)
         Running: robocopy ...
         Pruning old backup: D:/Backup/2025-01-01_09-00
         >>> print(result)
@@ -1172,36 +3083,120 @@ def headless_run(backup_root: Path, retention_days: int) -> int:
         - All output suitable for log files
         - Errors go to stderr for separate capture
         - Exit code can trigger alerts in monitoring systems
+        - Pruning runs detached, so its output is not logged
     """
-    # Simply run one backup cycle with the provided parameters
-    return run_once(backup_root, retention_days)
+    # Opt-in: let robocopy replace this process (never returns if it does)
+    # VSS needs the shadow copy deleted afterward, parallel subtrees need
+    # several robocopy runs, and skip_unchanged checks and records the change
+    # journal around the copy, so all three keep the normal path
+    if exec_replace and not use_vss and not parallel_subtrees and not skip_unchanged:
+        _exec_robocopy(backup_root, retention_days, threads, verbose, large_files, incremental)
+    
+    # Run one backup cycle; pruning is handed to a detached process so the
+    # Scheduled Task completes as soon as the copy does
+    return run_once(backup_root, retention_days, threads, detach_prune=True,
+                    verbose=verbose, large_files=large_files, use_vss=use_vss,
+                    incremental=incremental, parallel_subtrees=parallel_subtrees,
+                    skip_unchanged=skip_unchanged)
 
 
 # =============================
 # COMMAND-LINE ARGUMENT PARSING
 # =============================
 
+def _config_arg(value: str) -> dict:
+    """--config <path>: load and validate the whole file up front."""
+    try:
+        return load_config(value)
+    except ValueError as exc:
+        # Invalid file - a usage error (exit code 2), not a fall back to the
+        # prompts: --config runs are unattended, so nobody would answer them
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+
+def _retention_days_arg(value: str) -> int:
+    """--retention-days <int>: an invalid integer keeps the default."""
+    try:
+        # Validate integer value
+        return int(value)
+    except ValueError:
+        # Invalid integer - warn and use default
+        print("Invalid --retention-days. Using default.", file=sys.stderr)
+        return DEFAULT_RETENTION_DAYS
+
+def _threads_arg(value: str) -> int:
+    """--threads <int>: robocopy accepts 1-MAX_THREADS; anything else keeps the default."""
+    try:
+        val = int(value)
+        if not 1 <= val <= MAX_THREADS:
+            raise ValueError
+        return val
+    except ValueError:
+        # Invalid thread count - warn and use default
+        print("Invalid --threads. Using default.", file=sys.stderr)
+        return DEFAULT_THREADS
+
+# The command-line parser, built once at import
+# Each flag's dest is the parse_args result key it sets; the type callables
+# warn and keep the default instead of exiting on a bad value
+# add_help=False: -h is not a flag of this script (it starts the wizard)
+# allow_abbrev=False: only exact --long-flags are recognized
+_PARSER = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+_PARSER.add_argument("--headless-run", dest="mode", action="store_const", const="headless",
+                     default="interactive")                                   # Headless mode
+_PARSER.add_argument("--prune-only", dest="mode", action="store_const", const="prune")  # Prune-only mode
+_PARSER.add_argument("--verbose", action="store_true")                        # Verbose diagnostics
+_PARSER.add_argument("--large-files", action="store_true")                    # Unbuffered I/O (/J)
+_PARSER.add_argument("--use-vss", action="store_true")                        # VSS shadow copy
+_PARSER.add_argument("--incremental", action="store_const", const=True,
+                     default=DEFAULT_INCREMENTAL)                             # Hard-link snapshots
+_PARSER.add_argument("--full-copy", dest="incremental", action="store_const", const=False)  # No hard links
+_PARSER.add_argument("--parallel-subtrees", action="store_true")              # One robocopy per folder
+_PARSER.add_argument("--skip-unchanged", action="store_true")                # Skip copy if journal unchanged
+_PARSER.add_argument("--exec-replace", action="store_true")                   # exec robocopy if nothing to prune
+_PARSER.add_argument("--parallel-setup", action="store_true")                 # Register task during backup
+_PARSER.add_argument("--yes", action="store_true")                            # Accept every default, no prompts
+_PARSER.add_argument("--config", type=_config_arg, default=None)              # Settings file
+_PARSER.add_argument("--backup-root", default=DEFAULT_BACKUP_ROOT)            # Backup root path
+_PARSER.add_argument("--retention-days", type=_retention_days_arg,
+                     default=DEFAULT_RETENTION_DAYS)                          # Retention days
+_PARSER.add_argument("--threads", type=_threads_arg, default=DEFAULT_THREADS)  # Robocopy thread count
+
 def parse_args(argv: List[str]) -> dict:
     """
     Lightweight command-line argument parser.
     
-    This function provides minimal argument parsing without external dependencies.
-    It supports just the essential flags needed for headless operation.
+    This function parses the essential flags needed for headless operation
+    with the module-level _PARSER (argparse, built once at import).
     
     Args:
         argv (List[str]): Command line arguments (typically sys.argv[1:]).
     
     Returns:
         dict: Parsed arguments with keys:
-            - "mode": Either "interactive" or "headless"
+            - "mode": One of "interactive", "headless", or "prune"
             - "backup_root": Backup destination path
             - "retention_days": Days to retain backups
+            - "threads": Robocopy /MT thread count
+            - "verbose": True if robocopy's stderr should be shown
+            - "large_files": True if robocopy should use unbuffered I/O (/J)
+            - "use_vss": True if the copy should read from a VSS shadow copy
+            - "incremental": True if unchanged files should be hard-linked
+            - "parallel_subtrees": True for one robocopy per top-level folder
+            - "skip_unchanged": True to skip the copy if the journal hasn't moved
+            - "exec_replace": True to exec robocopy in headless runs
+            - "parallel_setup": True to register the task during the backup
+            - "yes": True to accept every default without prompting
+            - "config": Settings loaded from --config, or None
     
     Supported Arguments:
         --headless-run:
             Switch to headless mode (no user interaction)
             Used by scheduled tasks
         
+        --prune-only:
+            Only delete expired dated folders, then exit (no copy)
+            Spawned in the background by headless runs
+        
         --backup-root <path>:
             Specify backup destination directory
             Required for headless mode
@@ -1209,6 +3204,57 @@ def parse_args(argv: List[str]) -> dict:
         --retention-days <int>:
             Specify retention period in days
             Required for headless mode
+        
+        --threads <int>:
+            Robocopy copy threads (/MT:N), default: CPU count clamped to 8-32
+            Optional; lower it for HDD backup targets
+        
+        --verbose:
+            Also show robocopy's stderr and per-file lines (hidden by default)
+            Useful when diagnosing failed runs
+        
+        --large-files:
+            Use robocopy unbuffered I/O (/J)
+            Only helps when the OneDrive is dominated by very large files
+        
+        --use-vss:
+            Copy from a VSS shadow copy of the OneDrive volume
+            Requires Administrator; falls back to the live folder
+        
+        --incremental:
+            Hard-link files unchanged since the previous dated backup
+            On by default; accepted so older scheduled tasks keep working
+        
+        --full-copy:
+            Copy every file into every dated backup (no hard links)
+            Use when the backup root is not on NTFS
+        
+        --parallel-subtrees:
+            Copy each top-level OneDrive folder with its own robocopy
+            Helps deep trees on SSDs; --threads is shared between them
+        
+        --skip-unchanged:
+            Skip the copy when the OneDrive volume's change journal hasn't
+            moved since the last backup (needs Administrator). The journal
+            covers the whole volume, so only use it when OneDrive has a
+            drive to itself; on the system drive it never skips
+        
+        --exec-replace:
+            Headless only: replace Python with robocopy when nothing needs
+            pruning; the exit code is then not reported (see _exec_robocopy)
+        
+        --parallel-setup:
+            Interactive only: register the scheduled task with schtasks
+            while the one-time backup runs (both questions asked first)
+        
+        --yes:
+            Interactive only: skip every prompt and use the defaults, with
+            --backup-root, --retention-days, --threads and the copy flags
+            applied (see defaults_config); --config takes precedence
+        
+        --config <path>:
+            JSON file answering every interactive prompt (see load_config)
+            Interactive mode only; an invalid file is a usage error (exit code 2)
     
     Examples:
         Interactive (default):
@@ -1221,52 +3267,23 @@ def parse_args(argv: List[str]) -> dict:
             python main.py --backup-root "D:\\Backup"
     
     Parsing Rules:
-        - Unknown arguments are safely ignored
-        - Invalid values use defaults with warning
+        - Unknown arguments are ignored, with one warning listing them
+        - Invalid values use defaults with warning, except an invalid
+          --config file, which is a usage error (exit code 2)
+        - A value flag without its value is a usage error (exit code 2)
         - Order of arguments doesn't matter
-        - No short flags (only --long-flags)
+        - No short flags (only --long-flags, no abbreviations)
     
     Note:
-        - Intentionally simple (no argparse dependency)
-        - Could be extended for more options if needed
+        - Add new flags to _PARSER; the dest becomes the result key
         - Defaults ensure script always has valid values
     """
-    # Initialize with defaults
-    args = {
-        "mode": "interactive",
-        "backup_root": DEFAULT_BACKUP_ROOT,
-        "retention_days": DEFAULT_RETENTION_DAYS,
-    }
-    
-    # Parse arguments using simple position-based approach
-    i = 0
-    while i < len(argv):
-        tok = argv[i]
-        
-        # Check for headless mode flag
-        if tok == "--headless-run":
-            args["mode"] = "headless"
-            i += 1
-
-        # Check for backup root with value
-        elif tok == "--backup-root" and i + 1 < len(argv):
-            args["backup_root"] = argv[i + 1]
-            i += 2
-
-        # Check for retention days with value
-        elif tok == "--retention-days" and i + 1 < len(argv):
-            try:
-                # Validate integer value
-                args["retention_days"] = int(argv[i + 1])
-            except ValueError:
-                # Invalid integer - warn and use default
-                print("Invalid --retention-days. Using default.", file=sys.stderr)
-            i += 2
-
-        else:
-            # Unknown argument - skip it
-            # Interactive mode will ignore it safely
-            i += 1
+    # One pass over argv; defaults and value checks come from _PARSER
+    ns, unknown = _PARSER.parse_known_args(argv)
+    if unknown:
+        # Unknown arguments are skipped, but not silently
+        print(f"Ignoring unknown argument(s): {' '.join(unknown)}", file=sys.stderr)
+    args = vars(ns)
 
     return args
 
@@ -1298,6 +3315,10 @@ if __name__ == "__main__":
            - Triggered by --headless-run flag
            - No user interaction
            - Used by Task Scheduler
+        
+        3. Prune only:
+           - Triggered by --prune-only flag
+           - Deletes expired dated folders and exits
 
     Example Usage:
         Interactive:
@@ -1313,8 +3334,27 @@ if __name__ == "__main__":
     if parsed["mode"] == "headless":
         # Headless mode - called by Task Scheduler or automation
         # Run one backup cycle and exit with appropriate code
-        sys.exit(headless_run(Path(parsed["backup_root"]), int(parsed["retention_days"])))
+        sys.exit(headless_run(parsed["backup_root"], int(parsed["retention_days"]),
+                              int(parsed["threads"]), parsed["verbose"], parsed["large_files"],
+                              parsed["use_vss"], parsed["incremental"],
+                              parsed["parallel_subtrees"], parsed["skip_unchanged"],
+                              parsed["exec_replace"]))
+    elif parsed["mode"] == "prune":
+        # Prune-only mode - spawned detached by headless runs
+        # Nothing to prune if the backup root doesn't exist yet
+        prune_root = Path(parsed["backup_root"])
+        if prune_root.is_dir():
+            prune_old_backups(prune_root, int(parsed["retention_days"]))
+        sys.exit(0)
     else:
         # Interactive mode - normal manual execution
         # Start the interactive wizard for configuration and execution
-        sys.exit(interactive_main())
+        # --yes answers every prompt with its default (a --config file wins)
+        config = parsed["config"]
+        if config is None and parsed["yes"]:
+            try:
+                config = defaults_config(parsed)
+            except ValueError as exc:
+                # Same usage error (exit code 2) as an invalid --config file
+                _PARSER.error(f"--yes: {exc}")
+        sys.exit(interactive_main(parsed["verbose"], config, parsed["parallel_setup"]))
@@ -0,0 +1,393 @@
+# !/usr/bin/env python3
+"""prompts.py
+#
+#   OneDrive Versioned Backup Interactive - wizard prompts
+# =======================================================
+# Input and validation helpers used only by the interactive wizard (and by
+# --config validation). main.py imports this module on first use, so
+# headless runs from the Scheduled Task never load it.
+#
+# Everything here is self-contained: defaults are passed in by the caller,
+# nothing is imported from main.py.
+"""
+# -----------------------------
+# IMPORTS USED IN THIS MODULE
+# -----------------------------
+import re
+from typing import Optional, Tuple
+
+
+# Valid 24-hour HH:MM times (00:00-23:59), compiled once for validate_time_hhmm
+# The ranges are part of the pattern, so one fullmatch is the whole check
+# [0-9] rather than \d: \d also matches non-ASCII digits
+_TIME_RE = re.compile(r"(?:[01][0-9]|2[0-3]):[0-5][0-9]")
+
+# Accepted answers, built once at import so each check is one hash lookup
+_YES_ANSWERS = frozenset(("y", "yes"))
+_NO_ANSWERS = frozenset(("n", "no"))
+
+# Accepted schtasks /SC values; public because main.validate_config checks
+# --config and --yes settings against the same set as prompt_schedule
+SCHEDULE_TYPES = frozenset(("DAILY", "HOURLY", "MINUTE"))
+
+
+# =============================
+# UTILITIES: INPUT + VALIDATION
+# =============================
+
+def prompt_with_default(prompt_text: str, default_value: str) -> str:
+    """
+    Display an interactive prompt with a default value shown in brackets.
+    
+    This function provides a user-friendly way to collect input with sensible defaults.
+    The user can press Enter without typing to accept the default value.
+    
+    Args:
+        prompt_text (str): The question or instruction to display to the user.
+                          Should not include the brackets for the default.
+        default_value (str): The value to use if user presses Enter without input.
+                           This value is displayed in square brackets.
+    
+    Returns:
+        str: The user's input if provided, otherwise the default value.
+             Always returns a string, even for numeric defaults.
+    
+    Example:
+        >>> name = prompt_with_default("Enter your name", "John")
+        Enter your name [John]: Jane
+        >>> print(name)
+        'Jane'
+        
+        >>> path = prompt_with_default("Backup location", "D:\\Backup")
+        Backup location [D:\\Backup]: <user presses Enter>
+        >>> print(path)
+        'D:\\Backup'
+    
+    Note:
+        - Leading and trailing whitespace is stripped from user input
+        - Empty string defaults are handled correctly
+        - The function always returns a string type
+    """
+    # Format the prompt with the default value in square brackets
+    response = input(f"{prompt_text} [{default_value}]: ").strip()
+    
+    # Return user input if provided, otherwise return the default
+    # Convert default to string to ensure consistent return type
+    return response if response else str(default_value)
+
+def prompt_int_with_default(
+    prompt_text: str,
+    default_value: int,
+    min_value: int = 1,
+    max_value: Optional[int] = None
+) -> int:
+    """
+    Prompt for an integer value with validation and a default option.
+    
+    This function repeatedly prompts until valid input is received. It ensures
+    the returned value meets the minimum threshold requirement.
+    
+    Args:
+        prompt_text (str): The instruction text to display to the user.
+                          Should describe what integer is being requested.
+        default_value (int): The integer to use if user presses Enter without input.
+                           Must be >= min_value to be valid.
+        min_value (int, optional): The minimum acceptable value. Defaults to 1.
+                                  Used to prevent invalid inputs like 0 or negative numbers.
+        max_value (Optional[int], optional): The maximum acceptable value, or
+                                            None for no upper limit.
+    
+    Returns:
+        int: A validated integer that is >= min_value (and <= max_value).
+    
+    Example:
+        >>> days = prompt_int_with_default("Retention days", 30, min_value=1)
+        Retention days [30]: 45
+        >>> print(days)
+        45
+        
+        >>> hours = prompt_int_with_default("Interval in hours", 24, min_value=1)
+        Interval in hours [24]: 0
+        Enter an integer >= 1.
+        Interval in hours [24]: 12
+        >>> print(hours)
+        12
+    
+    Validation Process:
+        1. Check if input is empty (use default)
+        2. Check that it is plain ASCII digits, then convert with int()
+        3. Check if integer value is within min_value..max_value
+        4. Re-prompt if any validation fails
+    
+    Note:
+        - Non-numeric input triggers re-prompt with error message
+        - Values below min_value or above max_value trigger re-prompt
+        - Function loops indefinitely until valid input received
+    """
+    while True:
+        # Get raw input from user
+        raw = input(f"{prompt_text} [{default_value}]: ").strip()
+        
+        # Handle empty input - return default
+        if raw == "":
+            return int(default_value)
+        
+        # Validate numeric input: digits only, so int()'s extras ("+5", "1_000")
+        # are rejected; isascii() also rules out non-ASCII digits
+        val = int(raw) if raw.isascii() and raw.isdigit() else None
+        
+        # Check range constraints
+        if val is not None and val >= min_value and (max_value is None or val <= max_value):
+            return val
+        
+        # Invalid input - show error and loop
+        if max_value is None:
+            print(f"Enter an integer >= {min_value}.")
+        else:
+            print(f"Enter an integer from {min_value} to {max_value}.")
+
+def prompt_yes_no_default(prompt_text: str, default_yes: bool = False) -> bool:
+    """
+    Present a yes/no question with a default answer indicated by capitalization.
+    
+    This function follows Unix convention where the capitalized option is the default.
+    For example: [Y/n] means Yes is default, [y/N] means No is default.
+    
+    Args:
+        prompt_text (str): The yes/no question to ask the user.
+                          Should be phrased as a question but without the question mark.
+        default_yes (bool, optional): If True, default to Yes. If False, default to No.
+                                     Defaults to False (No) for safety.
+    
+    Returns:
+        bool: True if user chooses yes, False if user chooses no.
+    
+    Example:
+        >>> proceed = prompt_yes_no_default("Continue with backup", default_yes=True)
+        Continue with backup [Y/n]: <Enter>
+        >>> print(proceed)
+        True
+        
+        >>> delete = prompt_yes_no_default("Delete old files", default_yes=False)
+        Delete old files [y/N]: n
+        >>> print(delete)
+        False
+    
+    Accepted Inputs:
+        - For Yes: 'y', 'yes' (case-insensitive)
+        - For No: 'n', 'no' (case-insensitive)
+        - Empty input: uses the default based on default_yes parameter
+    
+    Note:
+        - Invalid inputs trigger re-prompt with instruction
+        - Input is case-insensitive
+        - Empty input always returns the default value
+    """
+    # Format the prompt options based on default
+    # Capital letter indicates the default option
+    default_str = "Y/n" if default_yes else "y/N"
+    
+    while True:
+        # Get user input and normalize to lowercase
+        raw = input(f"{prompt_text} [{default_str}]: ").strip().lower()
+        
+        # Handle empty input - return default
+        if raw == "" and not default_yes:
+            return False
+        if raw == "" and default_yes:
+            return True
+        
+        # Check for affirmative responses
+        if raw in _YES_ANSWERS:
+            return True
+        
+        # Check for negative responses
+        if raw in _NO_ANSWERS:
+            return False
+        
+        # Invalid input - show instruction and loop
+        print("Answer y or n.")
+
+def validate_time_hhmm(hhmm: str) -> bool:
+    """
+    Validate a time string in 24-hour HH:MM format.
+    
+    This function checks both the format and the logical validity of the time.
+    It ensures hours are 00-23 and minutes are 00-59.
+    
+    Args:
+        hhmm (str): Time string to validate, expected format "HH:MM".
+    
+    Returns:
+        bool: True if the time is valid, False otherwise.
+    
+    Example:
+        >>> validate_time_hhmm("09:30")
+        True
+        >>> validate_time_hhmm("24:00")  # Invalid hour
+        False
+        >>> validate_time_hhmm("12:60")  # Invalid minute
+        False
+        >>> validate_time_hhmm("9:30")   # Missing leading zero
+        False
+    
+    Validation Rules:
+        1. Must match pattern: exactly 2 digits, colon, 2 digits
+        2. Hour component must be 00-23 (24-hour format)
+        3. Minute component must be 00-59
+    
+    Note:
+        - Leading zeros are required (09:05, not 9:5)
+        - 24:00 is invalid (use 00:00 for midnight)
+        - Does not validate semantic meaning (e.g., business hours)
+    """
+    # Format and ranges in one match: HH is 00-23, MM is 00-59 (ASCII digits)
+    return _TIME_RE.fullmatch(hhmm) is not None
+
+def prompt_time_hhmm(prompt_text: str, default_value: str) -> str:
+    """
+    Prompt for a time in 24-hour HH:MM format with validation.
+    
+    This function ensures the user provides a valid time string, re-prompting
+    if the input is invalid. It's used for scheduling tasks at specific times.
+    
+    Args:
+        prompt_text (str): The instruction to show the user.
+                          Should explain what time is being requested.
+        default_value (str): The default time in HH:MM format to use if user
+                           presses Enter. Should be pre-validated.
+    
+    Returns:
+        str: A validated time string in HH:MM format.
+    
+    Example:
+        >>> start = prompt_time_hhmm("Daily backup time", "09:00")
+        Daily backup time [09:00]: 14:30
+        >>> print(start)
+        '14:30'
+        
+        >>> time = prompt_time_hhmm("Schedule time", "09:00")
+        Schedule time [09:00]: 25:00
+        Use 24-hour HH:MM, e.g., 09:00 or 18:30.
+        Schedule time [09:00]: 00:00
+        >>> print(time)
+        '00:00'
+    
+    Note:
+        - Continuously prompts until valid input received
+        - Shows helpful error message with format examples
+        - Always returns a string in HH:MM format
+    """
+    while True:
+        # Get time input from user
+        t = prompt_with_default(prompt_text, default_value)
+        
+        # Validate the time format and values
+        if validate_time_hhmm(t):
+            return t
+        
+        # Invalid input - show examples and loop
+        print("Use 24-hour HH:MM, e.g., 09:00 or 18:30.")
+
+def prompt_schedule(
+    default_schedule_type: str = "DAILY",
+    default_start_time: str = "09:00",
+    default_modifier: int = 1
+) -> Tuple[str, Optional[str], int]:
+    """
+    Interactively collect scheduling preferences from the user.
+    
+    This function guides the user through choosing how often the backup task
+    should run, with support for daily, hourly, and minute-based schedules.
+    
+    Args:
+        default_schedule_type (str, optional): Offered schedule type.
+        default_start_time (str, optional): Offered HH:MM start time.
+        default_modifier (int, optional): Offered HOURLY/MINUTE interval.
+    
+    Returns:
+        Tuple[str, Optional[str], int]: A tuple containing:
+            - schedule_type (str): One of "DAILY", "HOURLY", or "MINUTE"
+            - start_time (Optional[str]): Time in HH:MM format for task
+              alignment, or None for a MINUTE schedule without one (the
+              task then starts from the time it is registered, no /ST)
+            - modifier (int): Interval modifier (1 for DAILY, N for HOURLY/MINUTE)
+    
+    Schedule Types Explained:
+        DAILY:
+            - Runs once per day at a specific time
+            - User specifies the exact time (e.g., 09:00)
+            - Modifier is always 1 (ignored by schtasks)
+            - Best for: Regular daily backups
+        
+        HOURLY:
+            - Runs every N hours
+            - User specifies interval (e.g., every 2 hours)
+            - Start time aligns the schedule (first run)
+            - Best for: Frequent backups during work hours
+        
+        MINUTE:
+            - Runs every N minutes
+            - User specifies interval (e.g., every 30 minutes)
+            - Start time is optional (asked first, default no): every N
+              minutes rarely needs a fixed first run
+            - Best for: Critical data or testing
+    
+    Example Interaction:
+        Schedule type options supported here:
+          DAILY  - run once each day at the time you choose
+          HOURLY - run every N hours
+          MINUTE - run every N minutes
+        Choose schedule type (DAILY|HOURLY|MINUTE) [DAILY]: HOURLY
+        Every how many hours? (modifier /MO) [1]: 4
+        Start time (HH:MM) for first run [09:00]: 08:00
+        
+        Returns: ("HOURLY", "08:00", 4)
+    
+    Note:
+        - Input is case-insensitive (converted to uppercase)
+        - Invalid schedule types trigger re-prompt
+        - Each schedule type has appropriate follow-up questions
+    """
+    # Display clear options to the user
+    print("\nSchedule type options supported here:")
+    print("  DAILY  - run once each day at the time you choose")
+    print("  HOURLY - run every N hours")
+    print("  MINUTE - run every N minutes")
+
+    # Get and validate schedule type
+    while True:
+        sched = prompt_with_default("Choose schedule type (DAILY|HOURLY|MINUTE)", default_schedule_type).upper()
+        if sched in SCHEDULE_TYPES:
+            break
+        print("Type DAILY, HOURLY, or MINUTE.")
+
+    # Initialize return values with defaults
+    start_time = default_start_time
+    modifier = default_modifier
+
+    # Collect schedule-specific parameters
+    if sched == "DAILY":
+        # DAILY schedule: runs once per day at specified time
+        # schtasks command will use: /SC DAILY /ST HH:MM
+        start_time = prompt_time_hhmm("Start time (HH:MM) for daily run", default_start_time)
+        modifier = 1  # Modifier is ignored by schtasks for DAILY, but we keep it for consistency
+        
+    elif sched == "HOURLY":
+        # HOURLY schedule: runs every N hours starting at specified time
+        # schtasks command will use: /SC HOURLY /MO N /ST HH:MM
+        modifier = prompt_int_with_default("Every how many hours? (modifier /MO)", default_modifier, min_value=1)
+        start_time = prompt_time_hhmm("Start time (HH:MM) for first run", default_start_time)
+        
+    elif sched == "MINUTE":
+        # MINUTE schedule: runs every N minutes
+        # schtasks command will use: /SC MINUTE /MO N [/ST HH:MM]
+        modifier = prompt_int_with_default("Every how many minutes? (modifier /MO)", default_modifier, min_value=1)
+        # Start time for minute schedules helps with alignment but is optional in schtasks
+        # Without one, no /ST is passed and the task starts when registered
+        if prompt_yes_no_default("Align the first run to a start time?", default_yes=False):
+            start_time = prompt_time_hhmm("Start time (HH:MM) to align first run", default_start_time)
+        else:
+            start_time = None
+
+    return sched, start_time, modifier
@@ -0,0 +1,13 @@
+"""
+Shared pytest setup.
+
+main.py is a standalone script, not an installed package, so its folder is
+put on sys.path and the tests import it the way `python main.py` runs it.
+"""
+
+import sys
+from pathlib import Path
+
+# src/onedrive_versioned_backup_interactive (main.py and prompts.py)
+SCRIPT_DIR = Path(__file__).resolve().parent.parent / "src" / "onedrive_versioned_backup_interactive"
+sys.path.insert(0, str(SCRIPT_DIR))
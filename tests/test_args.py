@@ -0,0 +1,67 @@
+"""Tests for command-line parsing (parse_args and the value checks)."""
+
+import pytest
+
+import main
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("1", 1),
+    ("16", 16),
+    (str(main.MAX_THREADS), main.MAX_THREADS),
+])
+def test_threads_in_range(value, expected):
+    assert main._threads_arg(value) == expected
+
+
+@pytest.mark.parametrize("value", ["0", "-4", str(main.MAX_THREADS + 1), "eight", ""])
+def test_threads_out_of_range_keeps_default(value, capsys):
+    assert main._threads_arg(value) == main.DEFAULT_THREADS
+    assert "Invalid --threads" in capsys.readouterr().err
+
+
+def test_defaults():
+    parsed = main.parse_args([])
+    assert parsed["mode"] == "interactive"
+    assert parsed["backup_root"] == main.DEFAULT_BACKUP_ROOT
+    assert parsed["retention_days"] == main.DEFAULT_RETENTION_DAYS
+    assert parsed["threads"] == main.DEFAULT_THREADS
+    assert parsed["incremental"] is main.DEFAULT_INCREMENTAL
+    assert parsed["config"] is None
+
+
+def test_headless_flags():
+    parsed = main.parse_args(["--headless-run", "--backup-root", "E:\\B", "--retention-days", "7",
+                              "--threads", "4", "--full-copy", "--skip-unchanged"])
+    assert parsed["mode"] == "headless"
+    assert parsed["backup_root"] == "E:\\B"
+    assert parsed["retention_days"] == 7
+    assert parsed["threads"] == 4
+    assert parsed["incremental"] is False
+    assert parsed["skip_unchanged"] is True
+
+
+def test_task_arguments_round_trip():
+    # What a scheduled task passes is what parse_args reads back
+    argv = main._task_argv("main.py", "E:\\B", 7, 4, True, False, False, True, True)
+    parsed = main.parse_args(argv[1:])
+    assert (parsed["mode"], parsed["backup_root"], parsed["retention_days"], parsed["threads"]) == \
+        ("headless", "E:\\B", 7, 4)
+    assert parsed["large_files"] and not parsed["use_vss"] and not parsed["incremental"]
+    assert parsed["parallel_subtrees"] and parsed["skip_unchanged"]
+
+
+def test_unknown_arguments_are_ignored(capsys):
+    parsed = main.parse_args(["--headless-run", "--bogus"])
+    assert parsed["mode"] == "headless"
+    assert "--bogus" in capsys.readouterr().err
+
+
+def test_invalid_config_is_a_usage_error(tmp_path, capsys):
+    # Unattended runs must fail, not fall back to prompts nobody answers
+    path = tmp_path / "settings.json"
+    path.write_text('{"threads": 0}', encoding="utf-8")
+    with pytest.raises(SystemExit) as excinfo:
+        main.parse_args(["--config", str(path)])
+    assert excinfo.value.code == 2
+    assert "threads: expected an integer from 1 to 128, got 0" in capsys.readouterr().err
@@ -0,0 +1,71 @@
+"""Tests for load_config, the --config settings file."""
+
+import json
+
+import pytest
+
+import main
+
+
+def _load(tmp_path, data):
+    path = tmp_path / "settings.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return main.load_config(str(path))
+
+
+def test_empty_object_gives_defaults(tmp_path):
+    assert _load(tmp_path, {}) == main.CONFIG_DEFAULTS
+
+
+def test_values_override_defaults(tmp_path):
+    cfg = _load(tmp_path, {"backup_root": "E:/Backups", "schedule_type": "hourly",
+                           "modifier": 4, "run_now": False})
+    assert cfg["backup_root"] == "E:/Backups"
+    assert cfg["schedule_type"] == "HOURLY"
+    assert cfg["modifier"] == 4
+    assert cfg["run_now"] is False
+
+
+def test_daily_resets_modifier(tmp_path):
+    assert _load(tmp_path, {"schedule_type": "DAILY", "modifier": 4})["modifier"] == 1
+
+
+def test_minute_may_omit_start_time(tmp_path):
+    assert _load(tmp_path, {"schedule_type": "MINUTE", "start_time": None})["start_time"] is None
+
+
+@pytest.mark.parametrize("data, message", [
+    ({"retention_days": 0}, "retention_days: expected an integer >= 1, got 0"),
+    ({"retention_days": True}, "retention_days: expected an integer >= 1, got true"),
+    ({"threads": 129}, "threads: expected an integer from 1 to 128, got 129"),
+    ({"task_name": " "}, 'task_name: expected a non-empty string, got " "'),
+    ({"use_vss": "yes"}, 'use_vss: expected true or false, got "yes"'),
+    ({"schedule_type": "weekly"},
+     'schedule_type: expected "DAILY", "HOURLY" or "MINUTE", got "weekly"'),
+    ({"start_time": "25:00"},
+     'start_time: expected a 24-hour "HH:MM" string (or null for MINUTE), got "25:00"'),
+    ({"start_time": None},
+     'start_time: expected a 24-hour "HH:MM" string (or null for MINUTE), got null'),
+    ({"retention_dayz": 7}, "unknown setting(s): retention_dayz"),
+])
+def test_invalid_values_name_the_setting(tmp_path, data, message):
+    with pytest.raises(ValueError) as excinfo:
+        _load(tmp_path, data)
+    assert str(excinfo.value) == message
+
+
+def test_not_an_object(tmp_path):
+    with pytest.raises(ValueError, match="expected a JSON object"):
+        _load(tmp_path, [1, 2])
+
+
+def test_unreadable_file(tmp_path):
+    with pytest.raises(ValueError, match="cannot read"):
+        main.load_config(str(tmp_path / "missing.json"))
+
+
+def test_yes_settings_are_validated():
+    cfg = main.defaults_config(main.parse_args(["--yes", "--retention-days", "14"]))
+    assert cfg["retention_days"] == 14 and cfg["schedule_type"] == main.DEFAULT_SCHEDULE_TYPE
+    with pytest.raises(ValueError, match="retention_days: expected an integer >= 1, got 0"):
+        main.defaults_config(main.parse_args(["--yes", "--retention-days", "0"]))
@@ -0,0 +1,43 @@
+"""Tests for the --exec-replace fallbacks of _exec_robocopy."""
+
+import os
+import shutil
+
+import main
+
+
+def _setup(tmp_path, monkeypatch):
+    src = tmp_path / "OneDrive"
+    src.mkdir()
+    (src / "notes.txt").write_text("unchanged")
+    root = tmp_path / "Backup"
+    prev = root / "2000-01-01_00-00"
+    prev.mkdir(parents=True)
+    shutil.copy2(src / "notes.txt", prev / "notes.txt")
+    monkeypatch.setattr(main, "onedrive_path", lambda: src)
+    return root
+
+
+def _dated(root):
+    return sorted(p.name for p in root.iterdir() if main.is_stamp_name(p.name))
+
+
+def test_no_robocopy_on_path_seeds_nothing(tmp_path, monkeypatch):
+    root = _setup(tmp_path, monkeypatch)
+    monkeypatch.setattr(shutil, "which", lambda name: None)
+    assert main._exec_robocopy(str(root), 36500, 8, False, False, True) is None
+    assert _dated(root) == ["2000-01-01_00-00"]
+
+
+def test_failed_exec_removes_the_seeded_folder(tmp_path, monkeypatch, capsys):
+    root = _setup(tmp_path, monkeypatch)
+    monkeypatch.setattr(shutil, "which", lambda name: "robocopy")
+
+    def fail(file, args):
+        raise FileNotFoundError(2, "No such file or directory")
+
+    monkeypatch.setattr(os, "execvp", fail)
+    assert main._exec_robocopy(str(root), 36500, 8, False, False, True) is None
+    assert _dated(root) == ["2000-01-01_00-00"]
+    assert (root / "2000-01-01_00-00" / "notes.txt").read_text() == "unchanged"
+    assert "Could not start robocopy" in capsys.readouterr().err
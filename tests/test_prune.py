@@ -0,0 +1,48 @@
+"""Tests for _expired_backups, the list of dated folders pruning deletes."""
+
+import datetime as dt
+import subprocess
+from pathlib import Path
+
+import main
+
+
+def _stamp(days_ago):
+    return (dt.datetime.now() - dt.timedelta(days=days_ago)).strftime(main.STAMP_FMT)
+
+
+def _names(paths):
+    return sorted(p.name for p in paths)
+
+
+def test_only_folders_past_the_cutoff(tmp_path):
+    old, older, recent = _stamp(10), _stamp(20), _stamp(1)
+    for name in (old, older, recent):
+        (tmp_path / name).mkdir()
+    assert _names(main._expired_backups(tmp_path, 7)) == sorted([old, older])
+
+
+def test_keeps_the_newest_folder_when_all_expired(tmp_path):
+    old, older = _stamp(10), _stamp(20)
+    for name in (old, older):
+        (tmp_path / name).mkdir()
+    assert _names(main._expired_backups(tmp_path, 7)) == [older]
+
+
+def test_ignores_other_names_and_files(tmp_path):
+    (tmp_path / "Archive").mkdir()
+    (tmp_path / _stamp(30)).write_text("not a folder")
+    (tmp_path / main.LAST_SIZE_FILE).write_text("0")
+    assert main._expired_backups(tmp_path, 7) == []
+
+
+def test_batched_rmdir_skips_paths_cmd_would_expand(monkeypatch):
+    # cmd.exe expands %VAR% even inside quotes, so such paths never reach it
+    command_lines = []
+    monkeypatch.setattr(subprocess, "run", lambda cmd, **kwargs: command_lines.append(cmd))
+    main._batched_rmdir([Path("D:/Backups/100%done/%USERNAME%"), Path("D:/Backups/old")])
+    assert len(command_lines) == 1
+    assert "%" not in command_lines[0] and "rmdir /S /Q" in command_lines[0]
+    command_lines.clear()
+    main._batched_rmdir([Path("D:/Backups/%TEMP%")])
+    assert command_lines == []
@@ -0,0 +1,54 @@
+"""Tests for _robocopy_command, the argv shared by run_robocopy and --exec-replace."""
+
+from pathlib import Path
+
+import main
+
+SRC = Path("C:/Users/me/OneDrive")
+DST = Path("D:/OneDriveBackup/2025-01-15_09-30")
+
+
+def test_default_flags_in_order():
+    cmd = main._robocopy_command(SRC, DST, 8, verbose=False, large_files=False,
+                                 keep_existing=False)
+    assert cmd == ["robocopy", str(SRC), str(DST), "/MIR", *main._ROBOCOPY_BASE_FLAGS,
+                   "/MT:8", "/NFL", "/NDL"]
+
+
+def test_verbose_keeps_file_and_dir_lines():
+    cmd = main._robocopy_command(SRC, DST, 8, verbose=True, large_files=False,
+                                 keep_existing=False)
+    assert "/NFL" not in cmd and "/NDL" not in cmd
+
+
+def test_large_files_and_keep_existing():
+    cmd = main._robocopy_command(SRC, DST, 16, verbose=True, large_files=True,
+                                 keep_existing=True)
+    assert cmd[-5:] == ["/MT:16", "/J", "/XC", "/XN", "/XO"]
+
+
+def test_top_level_only_uses_purge():
+    cmd = main._robocopy_command(SRC, DST, 8, verbose=False, large_files=False,
+                                 keep_existing=False, recurse=False)
+    assert "/PURGE" in cmd and "/MIR" not in cmd
+
+
+SUMMARY = (
+    b"------------------------------------------------------------------------------\r\n"
+    b"\r\n"
+    b"               Total    Copied   Skipped  Mismatch    FAILED    Extras\r\n"
+    b"    Dirs :        12         2        10         0         0         0\r\n"
+    b"   Files :       340        25       315         0         0         0\r\n"
+    b"   Bytes :   1048576     65536    983040         0         0         0\r\n"
+    b"   Times :   0:00:01   0:00:00                       0:00:00   0:00:00\r\n"
+)
+
+
+def test_copied_bytes_from_summary():
+    assert main._robocopy_copied_bytes(SUMMARY) == 65536
+
+
+def test_copied_bytes_without_summary():
+    # e.g. a localized robocopy, or output cut off before the summary
+    assert main._robocopy_copied_bytes(b"  Octets :  1048576  65536\r\n") is None
+    assert main._robocopy_copied_bytes(b"") is None
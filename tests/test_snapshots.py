@@ -0,0 +1,32 @@
+"""Tests for finding the dated backup that incremental runs hard-link against."""
+
+import main
+
+
+def _make(root, *names):
+    for name in names:
+        (root / name).mkdir()
+
+
+def test_none_without_dated_folders(tmp_path):
+    _make(tmp_path, "Notes", "2025-01-15")
+    assert main.find_previous_snapshot(tmp_path, "2025-02-01_09-00") is None
+
+
+def test_newest_folder_before_the_new_stamp(tmp_path):
+    _make(tmp_path, "2025-01-10_09-00", "2025-01-20_09-00", "2025-01-15_09-00")
+    found = main.find_previous_snapshot(tmp_path, "2025-02-01_09-00")
+    assert found == tmp_path / "2025-01-20_09-00"
+
+
+def test_ignores_the_new_stamp_and_later_ones(tmp_path):
+    _make(tmp_path, "2025-01-10_09-00", "2025-02-01_09-00", "2025-03-01_09-00")
+    found = main.find_previous_snapshot(tmp_path, "2025-02-01_09-00")
+    assert found == tmp_path / "2025-01-10_09-00"
+
+
+def test_ignores_files_and_other_names(tmp_path):
+    _make(tmp_path, "2025-01-10_09-00", "2025-01-20_09-00x")
+    (tmp_path / "2025-01-25_09-00").write_text("not a folder")
+    found = main.find_previous_snapshot(tmp_path, "2025-02-01_09-00")
+    assert found == tmp_path / "2025-01-10_09-00"
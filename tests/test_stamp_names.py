@@ -0,0 +1,34 @@
+"""Tests for is_stamp_name, the check that keeps pruning to our own folders."""
+
+import pytest
+
+import main
+
+
+@pytest.mark.parametrize("name", [
+    "2025-01-15_09-30",
+    "1999-12-31_23-59",
+    "2025-13-99_99-99",  # Shape only: never parsed, only compared as strings
+])
+def test_accepts_stamp_shape(name):
+    assert main.is_stamp_name(name)
+
+
+@pytest.mark.parametrize("name", [
+    "",
+    "MyImportantData",
+    "2025-01-15_09-3",     # One character short
+    "2025-01-15_09-300",   # One character long
+    "2025-01-15 09-30",    # Wrong separator at offset 10
+    "2025_01-15_09-30",    # Wrong separator at offset 4
+    "2025-01-15_09:30",    # Wrong separator at offset 13
+    "2025-0a-15_09-30",    # Non-digit
+    "2025-01-15_09-3²",  # Superscript two: isdigit() alone accepts it
+    "٢025-01-15_09-30",  # Arabic-Indic digit
+])
+def test_rejects_other_names(name):
+    assert not main.is_stamp_name(name)
+
+
+def test_matches_timestamp_stamp():
+    assert main.is_stamp_name(main.timestamp_stamp())
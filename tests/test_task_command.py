@@ -0,0 +1,42 @@
+"""Tests for the scheduled task's command line (build_task_arguments and /TR)."""
+
+from pathlib import Path
+
+import main
+
+
+def test_plain_arguments_unquoted():
+    args = main.build_task_arguments(Path("main.py"), Path("D:\\Backup"), 30, threads=8)
+    assert args == ("main.py --headless-run --backup-root D:\\Backup "
+                    "--retention-days 30 --threads 8 --incremental")
+
+
+def test_spaces_are_quoted():
+    args = main.build_task_arguments(Path("C:\\My Tools\\main.py"), Path("D:\\My Backups"), 30)
+    assert args.startswith('"C:\\My Tools\\main.py" --headless-run --backup-root "D:\\My Backups" ')
+
+
+def test_trailing_backslash_survives_quoting():
+    # Doubled before the closing quote, otherwise it would escape the quote
+    args = main.build_task_arguments(Path("main.py"), Path("E:\\My Backups\\"), 30)
+    assert '--backup-root "E:\\My Backups\\\\" --retention-days' in args
+
+
+def test_embedded_quotes_are_escaped():
+    args = main.build_task_arguments(Path("main.py"), Path('D:\\Back "up"'), 30)
+    assert '--backup-root "D:\\Back \\"up\\"" --retention-days' in args
+
+
+def test_every_flag_in_order():
+    args = main.build_task_arguments(Path("main.py"), Path("D:\\Backup"), 7, threads=4,
+                                     large_files=True, use_vss=True, incremental=False,
+                                     parallel_subtrees=True, skip_unchanged=True)
+    assert args.endswith("--threads 4 --large-files --use-vss --full-copy "
+                         "--parallel-subtrees --skip-unchanged")
+
+
+def test_schtasks_tr_is_interpreter_plus_arguments():
+    cmd = main.build_schtasks_command("T", "DAILY", "09:00", 1, "C:\\Python 3\\python.exe",
+                                      Path("main.py"), Path("D:\\Backup"), 30)
+    arguments = main.build_task_arguments(Path("main.py"), Path("D:\\Backup"), 30)
+    assert cmd[cmd.index("/TR") + 1] == f'"C:\\Python 3\\python.exe" {arguments}'
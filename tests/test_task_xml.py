@@ -0,0 +1,94 @@
+"""Tests for the task XML and the /XML fallback for long /TR commands."""
+
+import os
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import main
+
+NS = {"t": "http://schemas.microsoft.com/windows/2004/02/mit/task"}
+
+
+def _parse(xml_text):
+    # Declared UTF-16, as schtasks reads the file
+    return ET.fromstring(xml_text.encode("utf-16"))
+
+
+def test_command_and_arguments_are_escaped():
+    task = _parse(main.build_task_xml("DAILY", "09:00", 1, "C:\\Py <3>\\python.exe",
+                                      '"C:\\A & B\\main.py" --headless-run'))
+    assert task.find("t:Actions/t:Exec/t:Command", NS).text == "C:\\Py <3>\\python.exe"
+    assert task.find("t:Actions/t:Exec/t:Arguments", NS).text == '"C:\\A & B\\main.py" --headless-run'
+
+
+def test_daily_trigger():
+    task = _parse(main.build_task_xml("DAILY", "09:30", 1, "python.exe", "main.py"))
+    trigger = task.find("t:Triggers/t:CalendarTrigger", NS)
+    assert trigger.find("t:StartBoundary", NS).text.endswith("T09:30:00")
+    assert trigger.find("t:ScheduleByDay/t:DaysInterval", NS).text == "1"
+
+
+def test_interval_triggers():
+    for schedule_type, interval in (("HOURLY", "PT4H"), ("MINUTE", "PT15M")):
+        modifier = int(interval[2:-1])
+        task = _parse(main.build_task_xml(schedule_type, None, modifier, "python.exe", "main.py"))
+        trigger = task.find("t:Triggers/t:TimeTrigger", NS)
+        assert trigger.find("t:Repetition/t:Interval", NS).text == interval
+
+
+def _child_tags(element):
+    return [child.tag.split("}")[1] for child in element]
+
+
+def test_trigger_children_in_schema_order():
+    # ElementTree accepts any order; schtasks /XML does not
+    daily = _parse(main.build_task_xml("DAILY", "09:30", 1, "python.exe", "main.py"))
+    assert _child_tags(daily.find("t:Triggers/t:CalendarTrigger", NS)) == \
+        ["StartBoundary", "ScheduleByDay"]
+    for schedule_type in ("HOURLY", "MINUTE"):
+        task = _parse(main.build_task_xml(schedule_type, None, 4, "python.exe", "main.py"))
+        assert _child_tags(task.find("t:Triggers/t:TimeTrigger", NS)) == \
+            ["Repetition", "StartBoundary"]
+
+
+def _create_command(backup_root):
+    return main._schtasks_create_command(
+        "T", "DAILY", "09:00", 1, "python.exe", Path("main.py"), backup_root, 30,
+        main.DEFAULT_THREADS, False, False, True, False, False
+    )
+
+
+def test_short_command_uses_tr():
+    cmd, xml_path = _create_command(Path("D:\\Backup"))
+    assert xml_path is None
+    assert "/TR" in cmd and "/XML" not in cmd
+
+
+def test_long_command_falls_back_to_xml():
+    backup_root = Path("D:\\" + "\\".join(["very long folder name"] * 12))
+    cmd, xml_path = _create_command(backup_root)
+    try:
+        assert xml_path is not None
+        assert cmd == ["schtasks", "/Create", "/TN", "T", "/XML", xml_path, "/F"]
+        with open(xml_path, encoding="utf-16") as fh:
+            task = _parse(fh.read())
+        arguments = task.find("t:Actions/t:Exec/t:Arguments", NS).text
+        assert f'--backup-root "{backup_root}"' in arguments
+    finally:
+        if xml_path is not None:
+            os.remove(xml_path)
+
+
+def test_fallback_starts_just_past_the_tr_limit():
+    # Grow the backup root until the /TR value is exactly at the limit
+    base_cmd, _ = _create_command(Path("D:\\B"))
+    short = len(base_cmd[base_cmd.index("/TR") + 1])
+    at_limit = Path("D:\\B" + "x" * (main._SCHTASKS_MAX_TR - short))
+    cmd, xml_path = _create_command(at_limit)
+    assert xml_path is None and len(cmd[cmd.index("/TR") + 1]) == main._SCHTASKS_MAX_TR
+    cmd, xml_path = _create_command(Path(str(at_limit) + "x"))
+    try:
+        assert xml_path is not None
+    finally:
+        if xml_path is not None:
+            os.remove(xml_path)